@@ -1,7 +1,7 @@
 
-import pygame
 from pygame.sprite import Sprite
 from typing import TYPE_CHECKING
+from assets import load_image
 
 if TYPE_CHECKING:
     from alien_fleet import AlienFleet
@@ -30,8 +30,7 @@ class Alien(Sprite):
         self.boundaries = fleet.game.screen.get_rect()
         self.settings = fleet.game.settings
         
-        self.image = pygame.image.load(self.settings.alien_file)
-        self.image = pygame.transform.scale(self.image, (self.settings.alien_w, self.settings.alien_h))
+        self.image = load_image(self.settings.alien_file, (self.settings.alien_w, self.settings.alien_h))
         
         self.rect = self.image.get_rect()
         self.rect.x = x
@@ -40,11 +39,14 @@ class Alien(Sprite):
         self.x = float(self.rect.x)
         self.y = float(self.rect.y)
         
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         """
         Update the position of the alien based on the fleet's direction and speed.
+
+        Args:
+            dt (float): length of the simulation step in seconds.
         """
-        temp_speed = self.settings.fleet_speed
+        temp_speed = self.settings.fleet_speed * dt
         
         self.x += temp_speed * self.fleet.fleet_direction       
         self.rect.x = self.x
@@ -58,11 +60,3 @@ class Alien(Sprite):
             bool: True if the alien is at the edge of the screen, False otherwise.
         """
         return(self.rect.right >= self.boundaries.right or self.rect.left <= self.boundaries.left)
-        
-    def draw_alien(self) -> None:
-        """
-        Draw the alien on the screen at its current position.
-        """
-        
-        self.screen.blit(self.image, self.rect)
-        
@@ -1,7 +1,9 @@
 
 import pygame
-import random
+import numpy as np
+from collections import deque
 from alien import Alien
+from spatial_hash import SpatialHash
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -28,6 +30,28 @@ class AlienFleet:
         self.fleet = pygame.sprite.Group()
         self.fleet_direction = self.settings.fleet_direction
         self.fleet_drop_speed = self.settings.fleet_drop_speed
+        self.step_offset = (0.0, 0.0) # Distance the fleet moved in the last simulation step
+        
+        # Collision grid sized to the fleet layout, rebuilt lazily after the fleet moves
+        self.spatial_hash = SpatialHash(self.settings.alien_w, self.settings.alien_h)
+        self._index_stale = True
+        
+        # Fleet geometry is computed once per screen and alien size, and upcoming formations
+        # are generated ahead of time, during pauses, so a new level only has to create the aliens
+        self._geometry_key = None
+        self._geometry = None
+        self.formations: deque = deque()
+        
+        # Whole-fleet surface used by the "composite" render mode, composed lazily after a new fleet
+        self.composite: pygame.Surface | None = None
+        self._composite_stale = True
+        self.composite_version = 0 # Bumped whenever the surface is drawn to, so renderers redraw their copies
+        self._composite_cells: dict[tuple[int, int], list[Alien]] = {} # Aliens by alien-sized cell of the surface
+        
+        # Aliens that define the fleet's extent: the leftmost, the rightmost and the lowest one
+        self.leftmost: Alien | None = None
+        self.rightmost: Alien | None = None
+        self.lowest: Alien | None = None
         
         self.createFleet()
         
@@ -37,22 +61,92 @@ class AlienFleet:
         Create the alien fleet based on the screen size and alien size.
         The fleet is arranged in a rectangle, and the number of aliens is calculated
         based on the screen dimensions.
+        The aliens are placed from the next cached formation; its replacement is generated
+        later, while the game is paused or idle (see `fill_formation_cache`).
+        With `settings.fleet_layers` above one, that many formations are stacked into the fleet,
+        each layer shifted down by a fraction of an alien so they don't line up exactly.
         """   
+        layers = self.settings.fleet_layers
+        for layer in range(layers):
+            xs, ys = self._next_formation()
+            shift = layer * self.settings.alien_h // layers
+            for current_x, current_y in zip(xs, ys):
+                self._create_alien(current_x, current_y + shift)
+        self.step_offset = (0.0, 0.0)
+        self._index_stale = True
+        self._composite_stale = True
+        self._update_extent()
+        
+        
+    def _update_extent(self) -> None:
+        """
+        Find the leftmost, rightmost and lowest living aliens.
+        The fleet moves and drops as one block, so movement never changes which aliens
+        are at its extent and their positions always give the current extent; it only has
+        to be searched again when a new fleet is created or one of those aliens is destroyed.
+        """
+        if not self.fleet:
+            self.leftmost = self.rightmost = self.lowest = None
+            return
+        aliens = self.fleet.sprites()
+        self.leftmost = min(aliens, key=lambda alien: alien.x)
+        self.rightmost = max(aliens, key=lambda alien: alien.x)
+        self.lowest = max(aliens, key=lambda alien: alien.y)
+        
+        
+    def _get_fleet_geometry(self) -> tuple:
+        """
+        Get the fleet grid size and offsets, computing them only when the screen or alien size changed.
+
+        Returns:
+            tuple: alien_w, alien_h, fleet_w, fleet_h, x_offset and y_offset
+        """
         alien_w = self.settings.alien_w
         alien_h = self.settings.alien_h
         screen_w = self.settings.screen_w
         screen_h = self.settings.screen_h
-        
-        fleet_w, fleet_h = self.calculate_fleet_size(alien_w, screen_w, alien_h, screen_h)        
-        x_offset, y_offset = self.calculate_offsets(alien_w, alien_h, screen_w, fleet_w, fleet_h)
-        
-        self._create_random_fleet(alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset)
-        
+        key = (alien_w, alien_h, screen_w, screen_h)
+        if key != self._geometry_key:
+            fleet_w, fleet_h = self.calculate_fleet_size(alien_w, screen_w, alien_h, screen_h)        
+            x_offset, y_offset = self.calculate_offsets(alien_w, alien_h, screen_w, fleet_w, fleet_h)
+            self._geometry_key = key
+            self._geometry = (alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset)
+        return self._geometry
+    
+    
+    def _next_formation(self) -> tuple[list[int], list[int]]:
+        """
+        Take the next formation from the cache, discarding cached formations that were made
+        for a different geometry or spawn chance.
+
+        Returns:
+            tuple[list[int], list[int]]: the x and y positions of the aliens, row by row.
+        """
+        key = (self._get_fleet_geometry(), self.settings.spawn_chance)
+        while self.formations:
+            formation_key, xs, ys = self.formations.popleft()
+            if formation_key == key:
+                return xs, ys
+        return self._create_random_fleet(*self._get_fleet_geometry())
+    
+    
+    def fill_formation_cache(self) -> None:
+        """
+        Generate one formation if the cache holds fewer than `settings.formation_cache_size`.
+        It is called on every paused step and idle frame, so the work is spread over frames
+        in which nothing else is simulated.
+        """
+        if len(self.formations) < self.settings.formation_cache_size:
+            key = (self._get_fleet_geometry(), self.settings.spawn_chance)
+            xs, ys = self._create_random_fleet(*self._get_fleet_geometry())
+            self.formations.append((key, xs, ys))
+    
 
     def _create_random_fleet(self, alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset):
         """
-        Create a rectangle fleet of aliens.
+        Create a random rectangle formation of aliens.
         The fleet is arranged in rows and columns, with a specified offset for positioning.
+        The occupied cells of the whole grid are rolled at once as a NumPy mask.
         
         Args:
             alien_w (int): width of the alien sprite
@@ -61,17 +155,21 @@ class AlienFleet:
             fleet_h (int): height of the fleet (number of aliens in a column)
             x_offset (int): offset for the x position of the fleet
             y_offset (int): offset for the y position of the fleet
+        Returns:
+            tuple[list[int], list[int]]: the x and y positions of the aliens, row by row.
         """
-        spawn_chance = 5 # Chance of spawning an alien in a given position
+        spawn_chance = self.settings.spawn_chance # Chance of spawning an alien in a given position
         
-        for row in range(fleet_h):
-            for column in range(fleet_w):
-                if random.randint(0,100) < spawn_chance:                    
-                    current_x = x_offset + (column * alien_w)
-                    current_y = y_offset + (row * alien_h)
-                    self._create_alien(current_x, current_y)
-                else:
-                    continue
+        # Seed NumPy from the game's generator, so seeded games still get the same formations
+        generator = np.random.default_rng(self.game.rng.getrandbits(64))
+        if spawn_chance >= 100:
+            mask = np.ones((fleet_h, fleet_w), dtype=bool)
+        else:
+            mask = generator.integers(0, 101, size=(fleet_h, fleet_w)) < spawn_chance
+        rows, columns = np.nonzero(mask)
+        xs = (x_offset + columns * alien_w).tolist()
+        ys = (y_offset + rows * alien_h).tolist()
+        return xs, ys
                 
 
     def calculate_offsets(self, alien_w, alien_h, screen_w, fleet_w, fleet_h):
@@ -129,7 +227,7 @@ class AlienFleet:
         
     def _create_alien(self, current_x: int, current_y: int):
         """
-        Create a new alien and add it to the fleet.
+        Create a new alien, add it to the fleet and remember its place in the fleet's order.
         The alien is positioned based on the current_x and current_y coordinates.
 
         Args:
@@ -137,21 +235,25 @@ class AlienFleet:
             current_y (int): the y-coordinate for the alien's position
         """
         new_alien = Alien(self, current_x, current_y)
-        
+        new_alien.index = len(self.fleet)
         self.fleet.add(new_alien)
         
     
-    def _check_fleet_edges(self) -> None:
+    def _check_fleet_edges(self) -> bool:
         """
-        Check if any alien in the fleet has reached the edge of the screen.
+        Check if the fleet has reached the edge of the screen, using its leftmost and rightmost aliens.
         If so, change the fleet's direction and drop the fleet down.
+
+        Returns:
+            bool: True if the fleet dropped, False otherwise.
         """
-        alien: "Alien"
-        for alien in self.fleet:
-            if alien.check_edges():
-                self._drop_alien_fleet()                
-                self.fleet_direction *= -1
-                break
+        if self.leftmost is None:
+            return False
+        if self.leftmost.check_edges() or self.rightmost.check_edges():
+            self._drop_alien_fleet()                
+            self.fleet_direction *= -1
+            return True
+        return False
             
     def _drop_alien_fleet(self) -> None:
         """
@@ -164,56 +266,246 @@ class AlienFleet:
             
             
                        
-    def update_fleet(self) -> None:
+    def update_fleet(self, dt: float) -> None:
         """
         Update the position of the fleet based on the fleet direction.
         If the fleet is moving to the right, move all aliens to the right.
         If the fleet is moving to the left, move all aliens to the left.
+
+        Args:
+            dt (float): length of the simulation step in seconds.
         """
-        self._check_fleet_edges()
-        self.fleet.update()
+        dropped = self._check_fleet_edges()
+        self.fleet.update(dt)
+        self._record_step(dt, dropped)
+        self._index_stale = True
         
         
-    def draw(self) -> None:
+    def _record_step(self, dt: float, dropped: bool) -> None:
+        """
+        Remember how far the fleet moved in this step, so drawing can interpolate between steps.
+        All aliens move together, so one offset covers the whole fleet.
+
+        Args:
+            dt (float): length of the simulation step in seconds.
+            dropped (bool): whether the fleet dropped down in this step.
+        """
+        step_x = self.settings.fleet_speed * dt * self.fleet_direction
+        step_y = self.fleet_drop_speed if dropped else 0.0
+        self.step_offset = (step_x, step_y)
+        
+        
+    def get_render_offset(self, alpha: float) -> tuple[int, int]:
+        """
+        Get the offset that moves the fleet back from its current simulation position
+        towards its previous one, for drawing in between two simulation steps.
+
+        Args:
+            alpha (float): how far the frame is between the previous step (0) and the current step (1).
+
+        Returns:
+            tuple[int, int]: the x and y offset to draw the fleet at.
+        """
+        step_x, step_y = self.step_offset
+        return (round((alpha - 1) * step_x), round((alpha - 1) * step_y))
+        
+        
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draw the entire fleet of aliens on the screen, from the fleet's draw items.
+
+        Args:
+            alpha (float): interpolation between the previous and the current simulation step.
         """
-        Draw the entire fleet of aliens on the screen.
-        This method iterates through all aliens in the fleet and calls their draw method.
+        self.game.screen.blits(self.get_draw_items(alpha), doreturn=False)
+            
+            
+    def get_draw_items(self, alpha: float = 1.0) -> list:
+        """
+        Get the images and rects of all aliens in the fleet.
+
+        Args:
+            alpha (float): interpolation between the previous and the current simulation step.
+
+        Returns:
+            list: (image, rect) pairs in drawing order.
+        """
+        offset = self.get_render_offset(alpha)
+        if self.settings.fleet_render_mode == "composite":
+            return self._get_composite_items(offset)
+        return [(alien.image, alien.rect.move(offset)) for alien in self.fleet]
+            
+            
+    def _get_composite_items(self, offset: tuple[int, int]) -> list:
+        """
+        Get the fleet as a single draw item: the composed fleet surface at the fleet's position.
+        All aliens move together, so the surface is placed using any living alien's position
+        relative to its place on the surface.
+
+        Args:
+            offset (tuple[int, int]): render offset used to interpolate between simulation steps.
+
+        Returns:
+            list: one (image, rect) pair, or no pairs if the fleet is empty.
+        """
+        if not self.fleet:
+            return []
+        if self._composite_stale:
+            self._compose_fleet()
+        alien = next(iter(self.fleet))
+        rect = self.composite.get_rect()
+        rect.topleft = (alien.rect.x - alien.composite_pos[0] + offset[0],
+                        alien.rect.y - alien.composite_pos[1] + offset[1])
+        return [(self.composite, rect)]
+            
+            
+    def _compose_fleet(self) -> None:
         """
+        Draw every alien of the fleet into one transparent surface the size of the formation,
+        remembering where on it each alien was drawn and grouping the aliens by the
+        alien-sized cell of the surface that holds their top-left corner.
+        """
+        rects = [alien.rect for alien in self.fleet]
+        bounds = rects[0].unionall(rects[1:])
+        self.composite = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        self._composite_cells = {}
+        alien_w = self.settings.alien_w
+        alien_h = self.settings.alien_h
         alien: "Alien"
         for alien in self.fleet:
-            alien.draw_alien()
+            alien.composite_pos = (alien.rect.x - bounds.x, alien.rect.y - bounds.y)
+            self.composite.blit(alien.image, alien.composite_pos)
+            key = (alien.composite_pos[0] // alien_w, alien.composite_pos[1] // alien_h)
+            self._composite_cells.setdefault(key, []).append(alien)
+        self._composite_stale = False
+        self.composite_version += 1
             
             
-    def check_collisions(self, other_group) -> bool:
+    def _erase_from_composite(self, aliens) -> None:
+        """
+        Remove destroyed aliens from the composed fleet surface in place, redrawing only the
+        cells they covered, and bump the surface's version so renderers see that it changed.
+        Aliens are no larger than a cell, so only the aliens of the surrounding cells can
+        overlap an erased alien.
+
+        Args:
+            aliens (Iterable[Alien]): the aliens that were destroyed.
+        """
+        self.composite_version += 1
+        alien_w = self.settings.alien_w
+        alien_h = self.settings.alien_h
+        for alien in aliens:
+            area = pygame.Rect(alien.composite_pos, alien.rect.size)
+            self.composite.fill((0, 0, 0, 0), area)
+            
+            # Redraw the parts of living neighbours that overlapped the erased area, in fleet order
+            col = alien.composite_pos[0] // alien_w
+            row = alien.composite_pos[1] // alien_h
+            neighbours = [neighbour
+                          for key in ((col + dx, row + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+                          for neighbour in self._composite_cells.get(key, ())
+                          if neighbour.alive() and area.colliderect(neighbour.composite_pos, neighbour.rect.size)]
+            neighbours.sort(key=lambda neighbour: neighbour.index)
+            self.composite.set_clip(area)
+            for neighbour in neighbours:
+                self.composite.blit(neighbour.image, neighbour.composite_pos)
+            self.composite.set_clip(None)
+            
+            
+    def _get_spatial_hash(self) -> SpatialHash:
+        """
+        Return the collision grid, rebuilding it first if the fleet has moved or been recreated.
+        Destroyed aliens are left in the grid until the next rebuild and skipped by the queries.
+
+        Returns:
+            SpatialHash: the grid holding the aliens at their current positions.
+        """
+        if self._index_stale:
+            self.spatial_hash.build(self.fleet)
+            self._index_stale = False
+        return self.spatial_hash
+    
+    
+    def check_collisions(self, other_group) -> dict:
         """
         Check for collisions between the alien fleet and another group of sprites.
-        This method uses pygame's sprite group collision detection to check for collisions.
+        Both the colliding aliens and the sprites that hit them are removed, like
+        pygame's groupcollide, but each sprite is only tested against the aliens near it.
+        A sprite that overlaps several aliens hits the one that was added to the fleet first,
+        the same alien groupcollide would pick.
 
         Args:
             other_group (pygame.sprite.Group): The other group of sprites to check for collisions with.
 
         Returns:
-            bool: True if there are collisions, False otherwise.
+            dict: the aliens that were hit, mapped to the list of sprites that hit them.
+        """
+        if not self.settings.use_spatial_hash:
+            collisions = pygame.sprite.groupcollide(self.fleet, other_group, True, True)
+        else:
+            collisions = self._collide_nearby(other_group)
         
+        if collisions and not self._composite_stale and self.composite is not None:
+            self._erase_from_composite(collisions)
+        if self.leftmost in collisions or self.rightmost in collisions or self.lowest in collisions:
+            self._update_extent()
+        return collisions
+    
+    
+    def _collide_nearby(self, other_group) -> dict:
+        """
+        Check each sprite of the other group against the aliens near it in the collision grid,
+        removing the sprites that hit and the aliens that were hit.
+
         Args:
-            other_group (container class): The other group of sprites to check for collisions with.
+            other_group (pygame.sprite.Group): The other group of sprites to check for collisions with.
 
         Returns:
-            bool: true if there are collisions, false otherwise.
+            dict: the aliens that were hit, mapped to the list of sprites that hit them.
+        """
+        spatial_hash = self._get_spatial_hash()
+        collisions = {}
+        for sprite in other_group.sprites():
+            hit = None
+            for alien in spatial_hash.query(sprite.rect):
+                if alien.alive() and sprite.rect.colliderect(alien.rect):
+                    if hit is None or alien.index < hit.index:
+                        hit = alien
+            if hit is not None:
+                collisions.setdefault(hit, []).append(sprite)
+                sprite.kill()
+        for alien in collisions:
+            alien.kill()
+        return collisions
+    
+    
+    def spritecollideany(self, sprite) -> "Alien | None":
         """
-        return pygame.sprite.groupcollide(self.fleet, other_group, True, True)         
+        Find an alien that collides with the given sprite.
+
+        Args:
+            sprite (Sprite): the sprite to test against the fleet, such as the player's ship.
+
+        Returns:
+            Alien | None: the first colliding alien, or None if there is no collision.
+        """
+        if not self.settings.use_spatial_hash:
+            return pygame.sprite.spritecollideany(sprite, self.fleet)
+        
+        for alien in self._get_spatial_hash().query(sprite.rect):
+            if alien.alive() and sprite.rect.colliderect(alien.rect):
+                return alien
+        return None
             
         
-    def check_fleet_bottom(self) -> None:
+    def check_fleet_bottom(self) -> bool:
         """
-        Check if any alien in the fleet has reached the bottom of the screen.
+        Check if the lowest alien in the fleet has reached the bottom of the screen.
         If so, return True to indicate that the fleet has reached the bottom.
         """
-        alien: "Alien"
-        for alien in self.fleet:
-            if alien.rect.bottom >= self.settings.screen_h:
-                return True
-        return False
+        if self.lowest is None:
+            return False
+        return self.lowest.rect.bottom >= self.settings.screen_h
     
     
     def check_destroyed_status(self) -> bool:
@@ -1,13 +1,32 @@
+import os
 import sys
+import random
+import argparse
 import pygame
 from settings import Settings
 from game_stats import GameStats
 from ship import Ship
 from arsenal import ShipArsenal
 from alien_fleet import AlienFleet
-from time import sleep
+from numpy_fleet import NumpyAlienFleet
+from time import perf_counter
+from typing import Callable
+from pathlib import Path
 from button import Button
 from hud import HUD
+from renderer import DirtyRenderer, ScaledRenderer, collect_scene_items
+from frame_profiler import FrameProfiler
+from capture_profiler import CaptureProfiler
+from input_recorder import InputRecorder, InputReplay, KEYDOWN, KEYUP, RESTART
+from latency import FramePacer, LatencyTracker
+from assets import AssetLoader, cache_image, decode_image, get_cached_image
+from audio import SoundPool, load_cached_sound
+
+# Keys whose presses and releases are written to input recordings
+RECORDED_KEYS = (pygame.K_RIGHT, pygame.K_LEFT, pygame.K_SPACE)
+# Event types the game handles, the only ones queued in low-latency mode
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN]
+
 
 class AlienInvasion:
     """
@@ -15,62 +34,373 @@ class AlienInvasion:
     This class is responsible for initializing the game, creating resources,
     and managing the game loop.  
     """
-    def __init__(self) -> None:
+    def __init__(self, headless: bool = False, seed: int | None = None, overrides: dict | None = None) -> None:
         """
         Initialize the game and create resources.
         This includes setting up the screen, loading images, and initializing sounds.
         The game starts with a ship and an alien fleet.
+        The sounds and the background image are loaded on a background thread and put in
+        place by the game loop when they are ready, so the menu is shown right away;
+        headless games wait for them here.
+
+        Args:
+            headless (bool): run without a window or audio device and without a frame cap.
+            seed (int | None): seed for the game's random number generator, random if None.
+            overrides (dict | None): settings to set to fixed values, see Settings.override.
         """           
         
-        # Initialize pygame and create resources
-        pygame.init()
+        self.start_time = perf_counter()
+        self.time_to_first_frame: float | None = None
+        self.time_to_assets: float | None = None
+        
+        # Headless runs use SDL's dummy drivers, which must be selected before the modules are initialized
+        self.headless = headless
+        if self.headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        
+        # Initialize only the pygame modules the game uses
+        pygame.display.init()
+        pygame.font.init()
+        pygame.mixer.init()
         self.settings = Settings()
         self.settings.initialize_dynamic_settings()
+        if overrides:
+            self.settings.override(**overrides)
+        
+        # All game randomness comes from this generator, so a seed and the input reproduce a session
+        self.seed = seed if seed is not None else random.randrange(2 ** 62)
+        self.rng = random.Random(self.seed)
+        self.recorder: InputRecorder | None = None
+        self.latency: LatencyTracker | None = None
         
         # Create the game screen
         self.screen = pygame.display.set_mode((self.settings.screen_w, self.settings.screen_h))
         pygame.display.set_caption(self.settings.name)
+        if self.settings.low_latency:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(HANDLED_EVENTS)
         
-        # Load the background image and scale it to fit the screen
-        self.bg = pygame.image.load(self.settings.bg_file)
-        self.bg = pygame.transform.scale(self.bg, (self.settings.screen_w, self.settings.screen_h))
+        # Decode the sounds and the background image in the background, drawing a plain background meanwhile;
+        # a background already cached by an earlier game in this process is used right away
+        self.assets = AssetLoader()
+        bg_size = (self.settings.screen_w, self.settings.screen_h)
+        self.bg = get_cached_image(self.settings.bg_file, bg_size, alpha=False)
+        if self.bg is None:
+            self.assets.submit("bg", decode_image, self.settings.bg_file, bg_size)
+            self.bg = pygame.Surface(self.screen.get_size()).convert()
+            self.bg.fill(self.settings.bg_color)
+        self.assets.submit("laser_sound", load_cached_sound, self.settings.laser_sound,
+                           self.settings.sound_cache_dir, 0.8) # Ship firing sound
+        self.assets.submit("impact_sound", load_cached_sound, self.settings.impact_sound,
+                           self.settings.sound_cache_dir, 0.8) # Impact sound for bullets hitting aliens
+        
+        # Each sound plays on its own reserved channels, up to its voice limit
+        self.sounds = SoundPool(self.settings.sound_voices)
                 
         self.game_stats = GameStats(self)
+        self.profiler = FrameProfiler(self.settings.profiler_window)
+        self.capture_profiler = CaptureProfiler(self.settings.profile_dir, self.settings.profile_capture_frames)
         self.HUD = HUD(self)
         
         self.running = True
         self.clock = pygame.time.Clock()
         
-        # Initialize game sounds
-        pygame.mixer.init()
-        self.laser_sound = pygame.mixer.Sound(self.settings.laser_sound) # Ship firing sound
-        self.laser_sound.set_volume(0.8)
-        
-        self.impact_sound = pygame.mixer.Sound(self.settings.impact_sound) # Impact sound for bullets hitting aliens
-        self.impact_sound.set_volume(0.8)       
-
         ## Initialize the ship and alien fleet
         self.ship = Ship(self, ShipArsenal(self))
-        self.alien_fleet = AlienFleet(self)
-        self.alien_fleet.createFleet()
+        self.alien_fleet = self._create_alien_fleet()
         
         self.play_button = Button(self, "Start Battle")
         self.game_active = False
+        
+        # Timed pause after losing a ship or clearing a level, counted down by the simulation steps
+        self.transition_remaining = 0.0
+        self.transition_message = ""
+        self.transition_action: Callable[[], None] | None = None
+        
+        self.dirty_renderer = DirtyRenderer(self) if self.settings.renderer == "dirty" else None
+        # Drawing at a reduced internal resolution takes over from the full or dirty renderer
+        self.scaled_renderer = ScaledRenderer(self) if self.settings.render_scale != 1.0 else None
+        
+        if self.headless:
+            self.wait_for_assets()
+
+    def _use_assets(self, assets: dict) -> None:
+        """
+        Put assets that finished loading in place of their stand-ins.
+
+        Args:
+            assets (dict): the loaded assets by name, as returned by the asset loader.
+        """
+        if "bg" in assets:
+            self.bg = cache_image(self.settings.bg_file, self.screen.get_size(), False, assets.pop("bg"))
+            if self.dirty_renderer is not None:
+                self.dirty_renderer.invalidate()
+        for name, sound in assets.items():
+            self.sounds.add(name, sound)
+        if not self.assets.pending and self.time_to_assets is None:
+            self.time_to_assets = perf_counter() - self.start_time
+
+    def wait_for_assets(self) -> None:
+        """
+        Wait until the assets loading in the background are ready and put them in place.
+        """
+        self._use_assets(self.assets.wait())
 
 
-    def run_game(self) -> None:
+    def _create_alien_fleet(self) -> AlienFleet:
+        """
+        Create the alien fleet using the backend selected in the settings.
+
+        Returns:
+            AlienFleet: the sprite based fleet, or the NumPy array based fleet.
+        """
+        if self.settings.fleet_backend == "numpy":
+            return NumpyAlienFleet(self)
+        return AlienFleet(self)
+
+    def run_game(self, max_frames: int | None = None, max_seconds: float | None = None) -> int:
         """
         Main loop of the game. This method handles the game events, updates the game state,
         and renders the game screen.
+        The game state advances in fixed simulation steps of `settings.time_step`. A frame that runs
+        late catches up with several steps (at most `settings.max_catch_up_steps`), and rendering
+        interpolates between the last two steps, so the game speed doesn't depend on the frame rate.
+        Headless runs advance exactly one step per frame.
+        Each stage runs through the frame profiler, which only times it while the overlay is on,
+        and a cProfile capture covers the frames it was scheduled or triggered for.
+        In low-latency mode the arrow keys are polled again right before the simulation steps,
+        and a precise frame pacer replaces the clock's frame cap.
+        The loop runs until the game is quit, or until the optional frame or time budget is used up.
+
+        Args:
+            max_frames (int | None): stop after this many frames.
+            max_seconds (float | None): stop after this many seconds of wall-clock time.
+
+        Returns:
+            int: the number of frames that were run.
         """
+        # Headless runs are not capped to the display frame rate
+        fps = 0 if self.headless else self.settings.FPS
+        time_step = self.settings.time_step
+        max_frame_time = time_step * self.settings.max_catch_up_steps
+        accumulator = 0.0
+        frames = 0
+        profiler = self.profiler
+        capture = self.capture_profiler
+        recorder = self.recorder
+        latency = self.latency
+        low_latency = self.settings.low_latency and not self.headless
+        pacer = FramePacer(fps, self.settings.pacer_spin_time) if low_latency else None
+        start = previous = perf_counter()
         while self.running:
-            self._check_events()
-            if self.game_active:
-                self.ship.update()
-                self.alien_fleet.update_fleet()
-                self._check_collisions()            
-            self._update_screen()
-            self.clock.tick(self.settings.FPS)
+            capture.begin_frame(frames)
+            now = perf_counter()
+            frame_time = time_step if self.headless else min(now - previous, max_frame_time)
+            previous = now
+            accumulator += frame_time
+            
+            if self.assets.pending:
+                self._use_assets(self.assets.collect())
+            if self.headless and not self.game_active:
+                self.restart_game()
+            profiler.measure("events", self._check_events)
+            if low_latency:
+                self._poll_keys()
+            if not self.game_active:
+                self.alien_fleet.fill_formation_cache()
+            steps = 0
+            while accumulator >= time_step:
+                if self.game_active:
+                    self._update_simulation(time_step)
+                    steps += 1
+                accumulator -= time_step
+            if recorder is not None:
+                recorder.end_frame(steps)
+            if latency is not None and steps:
+                latency.step_simulated()
+            profiler.measure("screen", self._update_screen, accumulator / time_step)
+            if latency is not None:
+                latency.frame_presented()
+            if self.time_to_first_frame is None:
+                self.time_to_first_frame = perf_counter() - self.start_time
+            if pacer is not None:
+                pacer.wait()
+            else:
+                self.clock.tick(fps)
+            profiler.end_frame()
+            capture.end_frame_reached(frames)
+            
+            frames += 1
+            if max_frames is not None and frames >= max_frames:
+                break
+            if max_seconds is not None and perf_counter() - start >= max_seconds:
+                break
+        capture.finish()
+        if recorder is not None:
+            recorder.save()
+        if latency is not None:
+            print(latency.format_report())
+        return frames
+    
+    def start_recording(self, path: Path) -> None:
+        """
+        Record the input of this session to a file, so it can be replayed with `run_replay`.
+        The recording is written when run_game ends or the game is quit.
+
+        Args:
+            path (Path): the file to write the recording to.
+        """
+        self.recorder = InputRecorder(path, self.seed)
+    
+    def track_latency(self) -> None:
+        """
+        Measure the input-to-photon latency of key presses and releases.
+        The histograms are printed when run_game ends or the game is quit.
+        """
+        self.latency = LatencyTracker(self.settings.latency_max_ms, self.settings.latency_bin_ms)
+    
+    def run_replay(self, replay: InputReplay, render: bool = True) -> dict:
+        """
+        Replay a recorded session as fast as possible.
+        The recorded key presses and releases go through the same keydown and keyup handlers
+        as live input, and each frame runs the same number of simulation steps as when it was
+        recorded. The game must have been created with the recording's seed.
+
+        Args:
+            replay (InputReplay): the recording to play back.
+            render (bool): draw every frame, so rendering is part of the workload.
+
+        Returns:
+            dict: frames and steps run, elapsed seconds, frames per second and the final game stats.
+        """
+        if replay.seed != self.seed:
+            raise ValueError("The game must be created with the recording's seed")
+        time_step = self.settings.time_step
+        steps_run = 0
+        start = perf_counter()
+        for steps, events in replay.frames:
+            for kind, key in events:
+                if kind == RESTART:
+                    self.restart_game()
+                elif kind == KEYDOWN:
+                    self._check_keydown_events(pygame.event.Event(pygame.KEYDOWN, key=key))
+                elif kind == KEYUP:
+                    self._check_keyup_events(pygame.event.Event(pygame.KEYUP, key=key))
+            for _ in range(steps):
+                self._update_simulation(time_step)
+            steps_run += steps
+            if render:
+                self._update_screen()
+        elapsed = perf_counter() - start
+        return {
+            "frames": len(replay.frames),
+            "steps": steps_run,
+            "seconds": elapsed,
+            "fps": len(replay.frames) / elapsed if elapsed > 0 else 0.0,
+            "score": self.game_stats.score,
+            "level": self.game_stats.level,
+            "ships_left": self.game_stats.ships_left,
+            }
+    
+    def run_headless(self, max_frames: int | None = None, max_seconds: float | None = None) -> dict:
+        """
+        Run the game as fast as possible for a fixed frame count or time budget and report the throughput.
+        The game is restarted whenever it ends so every frame exercises the full update and draw path.
+
+        Args:
+            max_frames (int | None): number of frames to simulate.
+            max_seconds (float | None): wall-clock time budget in seconds.
+
+        Returns:
+            dict: frames run, elapsed seconds, frames per second and seconds from creating the game to its first frame.
+        """
+        if max_frames is None and max_seconds is None:
+            raise ValueError("A headless run needs a frame count or a time budget")
+        start = perf_counter()
+        frames = self.run_game(max_frames, max_seconds)
+        elapsed = perf_counter() - start
+        return {
+            "frames": frames,
+            "seconds": elapsed,
+            "fps": frames / elapsed if elapsed > 0 else 0.0,
+            "time_to_first_frame": self.time_to_first_frame,
+            }
+    
+    def _update_simulation(self, dt: float) -> None:
+        """
+        Advance the game state by one simulation step.
+
+        Args:
+            dt (float): length of the simulation step in seconds.
+        """
+        if self.transition_action is not None:
+            self._update_transition(dt)
+            return
+        profiler = self.profiler
+        if self.settings.auto_fire:
+            self._fire_bullet()
+        profiler.measure("ship", self.ship.update, dt)
+        profiler.measure("fleet", self.alien_fleet.update_fleet, dt)
+        profiler.measure("collisions", self._check_collisions)
+    
+    def _start_transition(self, message: str, action: Callable[[], None]) -> None:
+        """
+        Pause the simulation for `settings.transition_time` seconds while events and rendering
+        keep running, showing a countdown, then run the given action.
+
+        Args:
+            message (str): the text shown above the countdown.
+            action (Callable[[], None]): the function to run when the pause is over.
+        """
+        self.transition_remaining = self.settings.transition_time
+        self.transition_message = message
+        self.transition_action = action
+        self._stop_interpolation()
+        self._discard_waiting_inputs()
+        self.HUD.update_countdown(self.transition_message, self.transition_remaining)
+    
+    def _stop_interpolation(self) -> None:
+        """
+        Draw the ship, bullets and fleet at their current positions, without interpolating the
+        last step, while nothing moves during a pause or after the game is over.
+        """
+        self.ship.previous_x = self.ship.x
+        self.ship.arsenal.step_distance = 0.0
+        self.alien_fleet.step_offset = (0.0, 0.0)
+    
+    def _discard_waiting_inputs(self) -> None:
+        """
+        Stop timing the inputs no simulation step has applied yet, when the game stops running
+        or restarts, so they are not timed against a frame that doesn't show them.
+        """
+        if self.latency is not None:
+            self.latency.discard_waiting()
+    
+    def _update_transition(self, dt: float) -> None:
+        """
+        Count down the current pause, generating upcoming fleet formations meanwhile, and run
+        its action once it is over.
+
+        Args:
+            dt (float): length of the simulation step in seconds.
+        """
+        self.transition_remaining -= dt
+        if self.transition_remaining > 0:
+            self.HUD.update_countdown(self.transition_message, self.transition_remaining)
+            self.alien_fleet.fill_formation_cache()
+            return
+        action = self.transition_action
+        self._end_transition()
+        action()
+    
+    def _end_transition(self) -> None:
+        """
+        Leave the pause without running its action and hide the countdown.
+        """
+        self.transition_remaining = 0.0
+        self.transition_action = None
+        self.HUD.clear_countdown()
     
     def _check_collisions(self) -> None:
         """
@@ -79,27 +409,24 @@ class AlienInvasion:
         the alien fleet and the screen bottom, and between bullets and aliens.
         If a collision is detected, the game status is updated accordingly.
         """
-        if self.ship.check_collisions(self.alien_fleet.fleet):
-           self._check_game_status()         
-        
-        # check collisions for aliens and screen bottom
-        if self.alien_fleet.check_fleet_bottom():
+        # check collisions for the ship and aliens, and for aliens and screen bottom
+        if self.ship.check_collisions(self.alien_fleet) or self.alien_fleet.check_fleet_bottom():
             self._check_game_status()
+            return
         
         # check collisions for bullets and aliens           
         collisions = self.alien_fleet.check_collisions(self.ship.arsenal.arsenal)        
         if collisions:
-            self.impact_sound.play()
-            self.impact_sound.fadeout(750)
+            self.sounds.play("impact_sound", 750)
             self.game_stats.update(collisions)
             self.HUD.update_scores()
         
         # check if all aliens are destroyed
         if self.alien_fleet.check_destroyed_status():
-            self._reset_level()
             self.settings.increase_difficulty()
             self.game_stats.update_level()        
             self.HUD.update_level()  
+            self._start_transition(f"Level {self.game_stats.level}", self._reset_level)
     
     
     def _check_game_status(self) -> None:
@@ -107,20 +434,22 @@ class AlienInvasion:
         Check the game status and update the game state accordingly.
         If the ship collides with an alien or the fleet reaches the bottom of the screen,
         the round is over and a player ship is lost. If the ship has no lives left, the game ends.
+        The level is reset at the end of a short pause, without blocking the game loop.
         """
         if self.game_stats.ships_left  > 0:
             self.game_stats.ships_left -= 1
-            self._reset_level()
-            sleep(1)
+            self._start_transition("Ship lost", self._reset_level)
         else:
             self.game_active = False
+            self._stop_interpolation()
+            self._discard_waiting_inputs()
                         
            
     def _reset_level(self) -> None:
         """
         Reset the game level by removing all bullets and aliens, and creating a new fleet.
         """
-        self.ship.arsenal.arsenal.empty()
+        self.ship.arsenal.clear()
         self.alien_fleet.fleet.empty()
         self.alien_fleet.createFleet()
         
@@ -128,31 +457,41 @@ class AlienInvasion:
         """
         Restart the game by resetting the game stats and creating a new fleet.
         """
+        if self.recorder is not None:
+            self.recorder.record_restart()
         self.settings.initialize_dynamic_settings()
         self.game_stats.reset_stats()
         self.HUD.update_scores()
+        self._end_transition()
+        self._discard_waiting_inputs()
         self._reset_level()
         self.ship._center_ship()
         self.game_active = True
         pygame.mouse.set_visible(False) 
         
         
-    def _update_screen(self):
+    def _update_screen(self, alpha: float = 1.0):
         """
         Update the screen with the latest game state.
         This method draws the background, ship, and alien fleet on the screen.
+
+        Args:
+            alpha (float): how far the frame is between the previous simulation step (0)
+                and the current one (1), used to interpolate the moving sprites.
         """
-        # Update the screen with the latest game state
-        self.screen.blit(self.bg, (0, 0))
-        self.ship.draw()
-        self.alien_fleet.draw()
-        self.HUD.draw()
-        
         if not self.game_active:
-            self.play_button.draw_button()
             pygame.mouse.set_visible(True)
         
-        self.ship.draw()        
+        if self.scaled_renderer is not None:
+            self.scaled_renderer.draw(alpha)
+            return
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.draw(alpha)
+            return
+        
+        # Update the screen with the latest game state, from the same draw items as the renderers
+        self.screen.blit(self.bg, (0, 0))
+        self.screen.blits(collect_scene_items(self, alpha), doreturn=False)
         pygame.display.flip()
 
 
@@ -164,18 +503,95 @@ class AlienInvasion:
         # Check for keyboard and mouse events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                self.running = False
-                self.game_stats.save_scores()
-                pygame.quit()
-                sys.exit()                
+                self._quit_game()
             elif event.type == pygame.KEYUP:
                 self._check_keyup_events(event)                                
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                self.capture_profiler.trigger()
             elif event.type == pygame.KEYDOWN and self.game_active == True:
                 self._check_keydown_events(event)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 self._check_button_clicked()
                 
 
+    def _quit_game(self) -> None:
+        """
+        Save the scores, the input recording and any running profile capture, report the input
+        latency if it was measured, then close the game.
+        """
+        self.running = False
+        self.game_stats.close()
+        if self.recorder is not None:
+            self.recorder.save()
+        if self.latency is not None:
+            print(self.latency.format_report())
+        self.capture_profiler.finish()
+        pygame.quit()
+        sys.exit()
+    
+    
+    def _is_repeated_movement(self, key: int, pressed: bool) -> bool:
+        """
+        Check if an arrow key event only repeats the ship's current movement, e.g. because
+        low-latency key polling already applied it before the event was read.
+
+        Args:
+            key (int): the pygame key code.
+            pressed (bool): True for a key press, False for a release.
+
+        Returns:
+            bool: True if the event would not change the ship's movement.
+        """
+        if key == pygame.K_RIGHT:
+            return self.ship.moving_right == pressed
+        if key == pygame.K_LEFT:
+            return self.ship.moving_left == pressed
+        return False
+    
+    
+    def _poll_keys(self) -> None:
+        """
+        Read the arrow keys' current state right before the simulation steps and dispatch the
+        presses and releases that the event queue has not delivered yet.
+        """
+        if not self.game_active:
+            return
+        pygame.event.pump()
+        pressed = pygame.key.get_pressed()
+        for key in (pygame.K_RIGHT, pygame.K_LEFT):
+            if pressed[key] and not self._is_repeated_movement(key, True):
+                self._check_keydown_events(pygame.event.Event(pygame.KEYDOWN, key=key))
+            elif not pressed[key] and not self._is_repeated_movement(key, False):
+                self._check_keyup_events(pygame.event.Event(pygame.KEYUP, key=key))
+    
+    
+    def _fire_bullet(self) -> bool:
+        """
+        Fire a bullet from the ship and play the firing sound if the arsenal had one to spare.
+
+        Returns:
+            bool: True if a bullet was fired.
+        """
+        if not self.ship.fire():
+            return False
+        self.sounds.play("laser_sound", 500)
+        return True
+    
+    
+    def _time_input(self, kind: str) -> None:
+        """
+        Start timing the latency of an input that changed the ship, if latency is measured and
+        the simulation is running, so the input shows up in the next simulated frame.
+
+        Args:
+            kind (str): "keydown" or "keyup".
+        """
+        if self.latency is not None and self.game_active and self.transition_action is None:
+            self.latency.input_received(kind)
+    
+    
     def _check_button_clicked(self):
         """
         function checks if the play button is clicked and the game is not active, then restarts the
@@ -194,10 +610,16 @@ class AlienInvasion:
         Args:
             event (key release): The event object containing information about the key release.
         """
+        if self._is_repeated_movement(event.key, False):
+            return
+        if self.recorder is not None and event.key in RECORDED_KEYS:
+            self.recorder.record_key(KEYUP, event.key)
         if event.key == pygame.K_RIGHT:
             self.ship.moving_right = False
+            self._time_input("keyup")
         elif event.key == pygame.K_LEFT:
             self.ship.moving_left = False
+            self._time_input("keyup")
     
     
     def _check_keydown_events(self, event) -> None:
@@ -209,24 +631,107 @@ class AlienInvasion:
         Args:
             event (key press): The event object containing information about the key press.
         """
+        if self._is_repeated_movement(event.key, True):
+            return
+        if self.recorder is not None and event.key in RECORDED_KEYS:
+            self.recorder.record_key(KEYDOWN, event.key)
         if event.key == pygame.K_RIGHT:
             self.ship.moving_right = True
+            self._time_input("keydown")
         elif event.key == pygame.K_LEFT:
             self.ship.moving_left = True
-        elif event.key == pygame.K_SPACE:
-            if self.ship.fire():
-               self.laser_sound.play()
-               self.laser_sound.fadeout(500)
+            self._time_input("keydown")
+        elif event.key == pygame.K_SPACE and self.transition_action is None:
+            if self._fire_bullet():
+                self._time_input("keydown")
         elif event.key == pygame.K_q:
-            self.running = False
-            self.game_stats.save_scores()
-            pygame.quit()
-            sys.exit()   
+            self._quit_game()
     
             
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line options for running the game.
+
+    Args:
+        argv (list[str] | None): the arguments to parse, defaults to sys.argv.
+
+    Returns:
+        argparse.Namespace: the parsed options.
+    """
+    parser = argparse.ArgumentParser(description="Alien Invasion")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a window, audio or frame cap")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="number of frames to run")
+    parser.add_argument("--seconds", type=float, default=None,
+                        help="wall-clock time budget in seconds")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for the game's random number generator")
+    parser.add_argument("--record", type=Path, default=None,
+                        help="record the session's input to this file")
+    parser.add_argument("--replay", type=Path, default=None,
+                        help="replay a recorded session headless as fast as possible")
+    parser.add_argument("--profile-frames", type=int, nargs=2, metavar=("START", "END"), default=None,
+                        help="run cProfile over frames START to END and write the report")
+    parser.add_argument("--profile-dir", type=Path, default=None,
+                        help="folder for the cProfile reports (F4 captures in game too)")
+    parser.add_argument("--latency", action="store_true",
+                        help="measure input-to-photon latency and print its histograms at the end")
+    parser.add_argument("--low-latency", action="store_true",
+                        help="filter events, poll the arrow keys right before simulating and pace frames precisely")
+    parser.add_argument("--startup-time", action="store_true",
+                        help="report the time to the first frame and until all assets are loaded, then exit")
+    args = parser.parse_args(argv)
+    if args.profile_frames is not None and args.profile_frames[1] <= args.profile_frames[0]:
+        parser.error("--profile-frames END must be greater than START")
+    if args.headless and args.frames is None and args.seconds is None:
+        parser.error("--headless needs --frames or --seconds")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Entry point for running the game from the command line.
+
+    Args:
+        argv (list[str] | None): the command line arguments, defaults to sys.argv.
+    """
+    args = parse_args(argv)
+    if args.replay is not None:
+        replay = InputReplay(args.replay)
+        ai = AlienInvasion(headless=True, seed=replay.seed)
+        result = ai.run_replay(replay)
+        print(f"{result['frames']} frames in {result['seconds']:.2f}s ({result['fps']:,.0f} FPS), "
+              f"score {result['score']}, level {result['level']}, ships left {result['ships_left']}")
+        return
+    
+    overrides = {"low_latency": True} if args.low_latency else None
+    ai = AlienInvasion(headless=args.headless, seed=args.seed, overrides=overrides)
+    if args.latency:
+        ai.track_latency()
+    if args.startup_time:
+        ai.run_game(max_frames=1)
+        ai.wait_for_assets()
+        print(f"First frame after {ai.time_to_first_frame * 1000:.1f} ms, "
+              f"assets loaded after {ai.time_to_assets * 1000:.1f} ms")
+        return
+    if args.record is not None:
+        ai.start_recording(args.record)
+    if args.profile_dir is not None:
+        ai.capture_profiler.output_dir = args.profile_dir
+    if args.profile_frames is not None:
+        ai.capture_profiler.schedule(*args.profile_frames)
+    if args.headless:
+        result = ai.run_headless(args.frames, args.seconds)
+        print(f"{result['frames']} frames in {result['seconds']:.2f}s ({result['fps']:,.0f} FPS), "
+              f"first frame after {result['time_to_first_frame'] * 1000:.1f} ms")
+    else:
+        ai.run_game(args.frames, args.seconds)
+        ai.game_stats.close()
+
+            
 if __name__ == '__main__':
-    ai = AlienInvasion()
-    ai.run_game()
+    main()
 
     
 
@@ -18,6 +18,9 @@ class ShipArsenal:
         The arsenal will also manage the firing of bullets, ensuring that the maximum number of bullets
         is not exceeded.
         The arsenal will also handle the removal of bullets that have gone off-screen.
+        Bullets are kept in a pool and reused, so firing does not create new bullets once
+        the pool holds `bullets_amount` of them. Without a limit, the pool grows to the most
+        bullets ever in flight.
         
         Args:
             game (AlienInvasion): The main game instance.             
@@ -25,36 +28,65 @@ class ShipArsenal:
         self.game = game
         self.settings = game.settings
         self.arsenal = pygame.sprite.Group()
+        self.step_distance = 0.0 # Distance the bullets moved in the last simulation step
+        self.pool: list[Bullet] = []
+        for _ in range(self.settings.bullets_amount or 0):
+            self.pool.append(Bullet(self.game, self.pool))
         
-    def update_arsenal(self) -> None:
+    def update_arsenal(self, dt: float) -> None:
         """
         Update the position of all bullets in the arsenal.
         This method will be called in the game loop to ensure that all bullets are updated
         and drawn on the screen.
+        Bullets that go off-screen retire themselves back to the pool as they move.
+
+        Args:
+            dt (float): length of the simulation step in seconds.
         """
-        self.arsenal.update()
-        self.remove_bullet_offscreen(self.arsenal)
-    
-    def remove_bullet_offscreen(self, bullet: Bullet) -> None:
+        self.step_distance = self.settings.bullet_speed * dt
+        self.arsenal.update(dt)
+        
+    def get_render_offset(self, alpha: float) -> tuple[int, int]:
         """
-        Remove bullets that have gone off-screen.
+        Get the offset that moves the bullets back from their current simulation position
+        towards their previous one, for drawing in between two simulation steps.
 
         Args:
-            bullet (Bullet): The bullet to check for off-screen status.
-        This method will check if the bullet's rectangle is off-screen (i.e., if its bottom is less than or equal to 0).
-        If it is, the bullet will be removed from the arsenal.
+            alpha (float): how far the frame is between the previous step (0) and the current step (1).
+
+        Returns:
+            tuple[int, int]: the x and y offset to draw the bullets at.
+        """
+        return (0, round((1 - alpha) * self.step_distance))
+        
+    def clear(self) -> None:
+        """
+        Retire all bullets in flight back to the pool.
         """
-        for bullet in self.arsenal.copy():
-            if bullet.rect.bottom <= 0:
-                self.arsenal.remove(bullet)
+        for bullet in self.arsenal.sprites():
+            bullet.kill()
         
-    def draw(self) -> None:
+    def draw(self, alpha: float = 1.0) -> None:
         """
-        This method will be called in the game loop to ensure that all bullets are drawn
-        on the screen.
+        Draw all bullets on the screen, from the arsenal's draw items.
+
+        Args:
+            alpha (float): interpolation between the previous and the current simulation step.
+        """
+        self.game.screen.blits(self.get_draw_items(alpha), doreturn=False)
+            
+    def get_draw_items(self, alpha: float = 1.0) -> list:
+        """
+        Get the images and rects of all bullets in the arsenal.
+
+        Args:
+            alpha (float): interpolation between the previous and the current simulation step.
+
+        Returns:
+            list: (image, rect) pairs in drawing order.
         """
-        for bullet in self.arsenal:
-            bullet.draw_bullet()
+        offset = self.get_render_offset(alpha)
+        return [(bullet.image, bullet.rect.move(offset)) for bullet in self.arsenal]
             
     def fire_bullet(self) -> None:
         """
@@ -71,8 +103,12 @@ class ShipArsenal:
         game settings and resources.
     
         """
-        if len(self.arsenal) < self.settings.bullets_amount:
-            new_bullet = Bullet(self.game)
+        limit = self.settings.bullets_amount
+        if limit is None or len(self.arsenal) < limit:
+            # Reuse a retired bullet; the pool only grows when bullets_amount is raised, or,
+            # without a limit, to the most bullets ever in flight at once
+            new_bullet = self.pool.pop() if self.pool else Bullet(self.game, self.pool)
+            new_bullet.activate(self.game.ship.rect.midtop)
             self.arsenal.add(new_bullet)
             return True
         return False
\ No newline at end of file
@@ -0,0 +1,148 @@
+import pygame
+from pathlib import Path
+from typing import Any, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Shared surfaces keyed by (path, size, alpha) so each image is decoded and scaled only once
+_image_cache: dict[tuple[str, tuple[int, int], bool], pygame.Surface] = {}
+
+
+def load_image(path: Path, size: tuple[int, int], alpha: bool = True) -> pygame.Surface:
+    """
+    Load an image, scale it and convert it to the display's pixel format, reusing the
+    cached surface if the same image at the same size has already been loaded.
+    The returned surface is shared between all callers and must not be drawn on.
+
+    Args:
+        path (Path): path to the image file.
+        size (tuple[int, int]): width and height to scale the image to.
+        alpha (bool): keep per-pixel transparency (convert_alpha) or convert to an opaque surface.
+
+    Returns:
+        pygame.Surface: the shared, scaled and converted surface.
+    """
+    image = get_cached_image(path, size, alpha)
+    if image is None:
+        image = cache_image(path, size, alpha, decode_image(path, size))
+    return image
+
+
+def get_cached_image(path: Path, size: tuple[int, int], alpha: bool = True) -> pygame.Surface | None:
+    """
+    Get an image from the cache without loading it.
+
+    Args:
+        path (Path): path to the image file.
+        size (tuple[int, int]): width and height the image was scaled to.
+        alpha (bool): whether the image was converted with per-pixel transparency.
+
+    Returns:
+        pygame.Surface | None: the shared surface, or None if it hasn't been loaded.
+    """
+    return _image_cache.get((str(path), (int(size[0]), int(size[1])), alpha))
+
+
+def cache_image(path: Path, size: tuple[int, int], alpha: bool, image: pygame.Surface) -> pygame.Surface:
+    """
+    Convert an image decoded with decode_image and add it to the cache, e.g. after loading
+    it on a background thread.
+
+    Args:
+        path (Path): path to the image file.
+        size (tuple[int, int]): width and height the image was scaled to.
+        alpha (bool): keep per-pixel transparency (convert_alpha) or convert to an opaque surface.
+        image (pygame.Surface): the decoded and scaled image.
+
+    Returns:
+        pygame.Surface: the shared, converted surface.
+    """
+    image = convert_image(image, alpha)
+    _image_cache[(str(path), (int(size[0]), int(size[1])), alpha)] = image
+    return image
+
+
+def decode_image(path: Path, size: tuple[int, int]) -> pygame.Surface:
+    """
+    Load an image and scale it, without touching the display, so it can run on a background thread.
+
+    Args:
+        path (Path): path to the image file.
+        size (tuple[int, int]): width and height to scale the image to.
+
+    Returns:
+        pygame.Surface: the scaled surface in the file's pixel format.
+    """
+    return pygame.transform.scale(pygame.image.load(path), size)
+
+
+def convert_image(image: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """
+    Convert a surface to the display's pixel format for fast blitting.
+
+    Args:
+        image (pygame.Surface): the surface to convert.
+        alpha (bool): keep per-pixel transparency (convert_alpha) or convert to an opaque surface.
+
+    Returns:
+        pygame.Surface: the converted surface, or the same surface if no display mode is set.
+    """
+    # Converting needs a display mode; without one the surface is kept as loaded
+    if pygame.display.get_surface() is None:
+        return image
+    return image.convert_alpha() if alpha else image.convert()
+
+
+def clear_cache() -> None:
+    """
+    Drop all cached surfaces, e.g. after the display mode has changed.
+    """
+    _image_cache.clear()
+
+
+class AssetLoader:
+    """
+    Loads slow assets, like decoding sounds and large images, on a background thread,
+    so the game can draw its first frames before they are ready.
+    The game loop picks up finished assets with `collect`; anything that needs the display,
+    like converting a surface, is left to the caller on the main thread.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize the loader with no assets pending. The thread starts with the first submitted asset.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AssetLoader")
+        self.pending: dict[str, Future] = {}
+
+    def submit(self, name: str, load: Callable[..., Any], *args: Any) -> None:
+        """
+        Queue an asset to be loaded in the background.
+
+        Args:
+            name (str): the name the asset is collected under.
+            load (Callable): the function that loads the asset, such as decode_image.
+            *args: the arguments passed to load.
+        """
+        self.pending[name] = self.executor.submit(load, *args)
+
+    def collect(self) -> dict[str, Any]:
+        """
+        Take the assets that have finished loading. Loading errors are raised here.
+
+        Returns:
+            dict[str, Any]: the finished assets by name, empty if none finished since the last call.
+        """
+        finished = {name: future for name, future in self.pending.items() if future.done()}
+        for name in finished:
+            del self.pending[name]
+        return {name: future.result() for name, future in finished.items()}
+
+    def wait(self) -> dict[str, Any]:
+        """
+        Wait for all pending assets to finish loading and take them.
+
+        Returns:
+            dict[str, Any]: the loaded assets by name.
+        """
+        pending = self.pending
+        self.pending = {}
+        return {name: future.result() for name, future in pending.items()}
@@ -0,0 +1,115 @@
+import os
+import hashlib
+import tempfile
+import pygame
+from pathlib import Path
+
+
+def load_cached_sound(path: Path, cache_dir: Path, volume: float) -> pygame.mixer.Sound:
+    """
+    Load a sound from the decoded PCM cache, decoding the source file and caching its samples
+    the first time. Cache files are named by a hash of the source file and the mixer format,
+    so an edited sound file or a different mixer setup never picks up stale samples.
+    The mixer must already be initialized.
+
+    Args:
+        path (Path): path to the sound file.
+        cache_dir (Path): the folder the decoded samples are cached in.
+        volume (float): playback volume from 0.0 to 1.0.
+
+    Returns:
+        pygame.mixer.Sound: the decoded sound.
+    """
+    frequency, size, channels = pygame.mixer.get_init()
+    digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    cache_path = cache_dir / f"{digest}_{frequency}_{size}_{channels}.pcm"
+    try:
+        sound = pygame.mixer.Sound(buffer=cache_path.read_bytes())
+    except FileNotFoundError:
+        sound = pygame.mixer.Sound(path)
+        _write_cache(cache_path, sound.get_raw())
+    sound.set_volume(volume)
+    return sound
+
+
+def _write_cache(cache_path: Path, samples: bytes) -> None:
+    """
+    Atomically write decoded samples to the cache, through a temporary file in the same folder.
+    A failed write only means the sound is decoded again on the next launch.
+
+    Args:
+        cache_path (Path): the cache file.
+        samples (bytes): the raw samples in the mixer's format.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+    except OSError as e:
+        print(f"Sound cache not written: {e}")
+        return
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(samples)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Sound cache not written: {e}")
+        Path(temp_path).unlink(missing_ok=True)
+
+
+class SoundPool:
+    """
+    Plays each sound on its own set of reserved mixer channels.
+    Every sound gets as many channels as its voice limit; a new play takes the sound's
+    next channel in turn, cutting off its oldest voice once all are busy. Sounds never
+    compete with each other for a free channel, and playing never searches for one.
+    """
+    def __init__(self, voices: dict[str, int]) -> None:
+        """
+        Reserve the mixer channels for every sound. The sounds are added once they are loaded.
+
+        Args:
+            voices (dict[str, int]): the number of voices, or channels, of each sound by name.
+        """
+        total = sum(voices.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+
+        self.sounds: dict[str, pygame.mixer.Sound] = {}
+        self.channels: dict[str, list[pygame.mixer.Channel]] = {}
+        self.next_voice: dict[str, int] = {}
+        first = 0
+        for name, count in voices.items():
+            self.channels[name] = [pygame.mixer.Channel(channel_id) for channel_id in range(first, first + count)]
+            self.next_voice[name] = 0
+            first += count
+
+    def add(self, name: str, sound: pygame.mixer.Sound) -> None:
+        """
+        Add a loaded sound to the pool.
+
+        Args:
+            name (str): the sound's name, one of the names given to the pool.
+            sound (pygame.mixer.Sound): the sound.
+        """
+        if name not in self.channels:
+            raise KeyError(f"No voices reserved for sound {name!r}")
+        self.sounds[name] = sound
+
+    def play(self, name: str, fadeout_ms: int) -> None:
+        """
+        Play a sound on its next voice and fade it out, unless it is still loading.
+
+        Args:
+            name (str): the sound's name.
+            fadeout_ms (int): milliseconds over which the sound fades out.
+        """
+        sound = self.sounds.get(name)
+        if sound is None:
+            return
+        channels = self.channels[name]
+        voice = self.next_voice[name]
+        self.next_voice[name] = (voice + 1) % len(channels)
+        channel = channels[voice]
+        channel.play(sound)
+        channel.fadeout(fadeout_ms)
@@ -0,0 +1,202 @@
+
+import random
+import argparse
+import itertools
+import numpy as np
+import pandas as pd
+from time import perf_counter
+from typing import Callable
+from concurrent.futures import ProcessPoolExecutor
+from alien_invasion import AlienInvasion
+from environment import Action, AlienInvasionEnv
+
+# An input policy maps the game, the frame number and the policy's own random generator
+# to the ship's controls for that frame
+Policy = Callable[[AlienInvasion, int, random.Random], Action]
+
+
+def idle_policy(game: AlienInvasion, frame: int, rng: random.Random) -> Action:
+    """
+    Never move or fire, so the run measures how long the fleet takes to reach the ship.
+    """
+    return False, False, False
+
+
+def sweep_policy(game: AlienInvasion, frame: int, rng: random.Random) -> Action:
+    """
+    Sweep across the screen, turning around every 1.5 seconds, and fire whenever possible.
+    """
+    moving_right = (frame // 90) % 2 == 0
+    return not moving_right, moving_right, True
+
+
+def track_policy(game: AlienInvasion, frame: int, rng: random.Random) -> Action:
+    """
+    Move under the lowest alien and fire when it is above the ship.
+    """
+    target = game.alien_fleet.lowest
+    if target is None:
+        return False, False, False
+    offset = target.rect.centerx - game.ship.rect.centerx
+    aligned = abs(offset) <= target.rect.width // 2
+    return offset < 0 and not aligned, offset > 0 and not aligned, aligned
+
+
+def random_policy(game: AlienInvasion, frame: int, rng: random.Random) -> Action:
+    """
+    Pick a random direction every quarter second, keeping the ship's direction in between, and fire at random.
+    """
+    fire = rng.random() < 0.2
+    if frame % 15:
+        return game.ship.moving_left, game.ship.moving_right, fire
+    direction = rng.choice((-1, 0, 1))
+    return direction < 0, direction > 0, fire
+
+
+POLICIES: dict[str, Policy] = {
+    "idle": idle_policy,
+    "sweep": sweep_policy,
+    "track": track_policy,
+    "random": random_policy,
+    }
+
+
+def run_single(run: dict) -> dict:
+    """
+    Play one headless game with a scripted input policy until it is over or runs out of frames.
+    Each frame runs one simulation step, and rendering only when the run asks for it.
+
+    Args:
+        run (dict): the run's "seed", "policy" name, settings "overrides", "max_frames"
+            and whether to "render".
+
+    Returns:
+        dict: the run's parameters, the level and score reached, the frames survived,
+            whether the game was over and the frame time statistics.
+    """
+    env = AlienInvasionEnv(run["overrides"], run["render"])
+    game = env.game
+    policy = POLICIES[run["policy"]]
+    policy_rng = random.Random(run["seed"])
+    frame_times = []
+    env.reset(run["seed"])
+    frames = 0
+    done = False
+    while not done and frames < run["max_frames"]:
+        start = perf_counter()
+        _, _, done, _ = env.step(policy(game, frames, policy_rng))
+        frame_times.append(perf_counter() - start)
+        frames += 1
+
+    times_ms = np.asarray(frame_times) * 1000
+    result = {
+        "seed": run["seed"],
+        "policy": run["policy"],
+        **run["overrides"],
+        "level": game.game_stats.level,
+        "score": game.game_stats.score,
+        "frames": frames,
+        "game_over": not game.game_active,
+        "mean_frame_ms": float(times_ms.mean()) if frames else 0.0,
+        "p99_frame_ms": float(np.percentile(times_ms, 99)) if frames else 0.0,
+        }
+    env.close()
+    return result
+
+
+def make_sweep(grid: dict[str, list], seeds: list[int], policy: str = "track",
+               max_frames: int = 3600, render: bool = False) -> list[dict]:
+    """
+    Build one run for every combination of the settings grid and every seed.
+
+    Args:
+        grid (dict[str, list]): the values to sweep for each setting, by setting name.
+        seeds (list[int]): the game seeds each settings combination is played with.
+        policy (str): the input policy name, one of POLICIES.
+        max_frames (int): the most frames a run lasts if the game isn't over before.
+        render (bool): draw every frame, so rendering is part of the frame times.
+
+    Returns:
+        list[dict]: the runs, ready for run_batch.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    names = list(grid)
+    runs = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        for seed in seeds:
+            runs.append({
+                "seed": seed,
+                "policy": policy,
+                "overrides": dict(zip(names, values)),
+                "max_frames": max_frames,
+                "render": render,
+                })
+    return runs
+
+
+def run_batch(runs: list[dict], processes: int | None = None) -> pd.DataFrame:
+    """
+    Play the runs across a pool of worker processes and collect their outcomes.
+
+    Args:
+        runs (list[dict]): the runs, e.g. from make_sweep.
+        processes (int | None): number of worker processes, one per core if None.
+
+    Returns:
+        pd.DataFrame: one row per run, in the order of the runs.
+    """
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        results = list(executor.map(run_single, runs))
+    return pd.DataFrame(results)
+
+
+def _parse_value(text: str) -> int | float | str:
+    """
+    Parse a setting value from the command line as an int or a float if possible.
+
+    Args:
+        text (str): the value as typed.
+
+    Returns:
+        int | float | str: the parsed value.
+    """
+    for parse in (int, float):
+        try:
+            return parse(text)
+        except ValueError:
+            pass
+    return text
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Run a settings sweep from the command line and write the results as CSV.
+
+    Args:
+        argv (list[str] | None): the command line arguments, defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Batch balancing runs for Alien Invasion")
+    parser.add_argument("--param", nargs="+", action="append", default=[], metavar=("NAME", "VALUE"),
+                        help="a setting and the values to sweep, e.g. --param fleet_speed 40 60 80")
+    parser.add_argument("--seeds", type=int, default=4, help="games played for each settings combination")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="track", help="scripted input policy")
+    parser.add_argument("--frames", type=int, default=3600, help="most frames a game lasts")
+    parser.add_argument("--render", action="store_true", help="draw every frame")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes, one per core by default")
+    parser.add_argument("--output", default=None, help="write the CSV to this file instead of stdout")
+    args = parser.parse_args(argv)
+    if any(len(param) < 2 for param in args.param):
+        parser.error("--param needs a setting name and at least one value")
+
+    grid = {name: [_parse_value(value) for value in values] for name, *values in args.param}
+    runs = make_sweep(grid, list(range(args.seeds)), args.policy, args.frames, args.render)
+    results = run_batch(runs, args.processes)
+    if args.output:
+        results.to_csv(args.output, index=False)
+    else:
+        print(results.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
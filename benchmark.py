@@ -0,0 +1,177 @@
+
+import json
+import argparse
+import numpy as np
+from time import perf_counter
+from alien_invasion import AlienInvasion
+
+# Stages of the run_game loop, timed one at a time in loop order
+STAGES = ("ship_update", "fleet_update", "collisions", "update_screen")
+
+
+class FrameBenchmark:
+    """
+    Times each stage of the game loop on a headless game instance while sweeping
+    the fleet density and the number of bullets in flight.
+    """
+    def __init__(self, frames: int = 120, seed: int = 0, fleet_backend: str = "sprite") -> None:
+        """
+        Initialize the benchmark and the headless game it runs on.
+
+        Args:
+            frames (int): number of frames measured for each configuration.
+            seed (int): seed for the random fleet layout, so runs are comparable.
+            fleet_backend (str): the fleet backend to measure, "sprite" or "numpy".
+        """
+        self.frames = frames
+        self.seed = seed
+        self.game = AlienInvasion(headless=True)
+        if self.game.settings.fleet_backend != fleet_backend:
+            self.game.settings.fleet_backend = fleet_backend
+            self.game.alien_fleet = self.game._create_alien_fleet()
+        time_step = self.game.settings.time_step
+        self.stages = {
+            "ship_update": lambda: self.game.ship.update(time_step),
+            "fleet_update": lambda: self.game.alien_fleet.update_fleet(time_step),
+            "collisions": self.game._check_collisions,
+            "update_screen": self.game._update_screen,
+            }
+
+    def _populate(self, spawn_chance: int, bullets: int) -> None:
+        """
+        Reset the game and fill the fleet and the arsenal for one configuration.
+
+        Args:
+            spawn_chance (int): chance (out of 100) of an alien in each fleet grid cell.
+            bullets (int): number of bullets kept in flight.
+        """
+        self.game.rng.seed(self.seed)
+        self.game.alien_fleet.formations.clear()
+        self.game.settings.spawn_chance = spawn_chance
+        self.game.restart_game()
+        self.game.settings.bullets_amount = bullets
+        self._top_up_bullets()
+
+    def _top_up_bullets(self) -> None:
+        """
+        Fire until the arsenal is full, spreading new bullets over the screen height
+        so the bullet count stays at the configured amount for the whole run.
+        """
+        arsenal = self.game.ship.arsenal
+        screen_h = self.game.settings.screen_h
+        while arsenal.fire_bullet():
+            bullet = arsenal.arsenal.sprites()[-1]
+            bullet.y = self.game.rng.uniform(0, screen_h)
+            bullet.rect.y = bullet.y
+
+    def run_config(self, spawn_chance: int, bullets: int) -> dict:
+        """
+        Measure one fleet density and bullet count.
+
+        Args:
+            spawn_chance (int): chance (out of 100) of an alien in each fleet grid cell.
+            bullets (int): number of bullets kept in flight.
+
+        Returns:
+            dict: the configuration, the average entity counts and the per-stage frame times.
+        """
+        self._populate(spawn_chance, bullets)
+        timings = {stage: [] for stage in STAGES}
+        totals = []
+        alien_counts = []
+        bullet_counts = []
+
+        for _ in range(self.frames):
+            self._top_up_bullets()
+            alien_counts.append(len(self.game.alien_fleet.fleet))
+            bullet_counts.append(len(self.game.ship.arsenal.arsenal))
+            frame_start = perf_counter()
+            for stage in STAGES:
+                start = perf_counter()
+                self.stages[stage]()
+                timings[stage].append(perf_counter() - start)
+            totals.append(perf_counter() - frame_start)
+            
+            # Skip the pause after a lost ship or cleared level, so every frame measures gameplay
+            if self.game.transition_action is not None:
+                self.game._update_transition(self.game.transition_remaining)
+
+        return {
+            "spawn_chance": spawn_chance,
+            "bullets_amount": bullets,
+            "mean_aliens": float(np.mean(alien_counts)),
+            "mean_bullets": float(np.mean(bullet_counts)),
+            "stages": {stage: _summarize(times) for stage, times in timings.items()},
+            "frame": _summarize(totals),
+            }
+
+    def run(self, densities: list[int], bullet_counts: list[int]) -> dict:
+        """
+        Measure every combination of fleet density and bullet count.
+
+        Args:
+            densities (list[int]): spawn chances to sweep.
+            bullet_counts (list[int]): bullet amounts to sweep.
+
+        Returns:
+            dict: the benchmark parameters and one result per configuration.
+        """
+        results = [self.run_config(density, bullets)
+                   for density in densities
+                   for bullets in bullet_counts]
+        return {
+            "frames": self.frames,
+            "seed": self.seed,
+            "fleet_backend": self.game.settings.fleet_backend,
+            "frame_budget_ms": 1000 / self.game.settings.FPS,
+            "results": results,
+            }
+
+
+def _summarize(times: list[float]) -> dict:
+    """
+    Summarize a list of stage times.
+
+    Args:
+        times (list[float]): stage times in seconds.
+
+    Returns:
+        dict: mean and 99th percentile in milliseconds.
+    """
+    times_ms = np.asarray(times) * 1000
+    return {
+        "mean_ms": float(times_ms.mean()),
+        "p99_ms": float(np.percentile(times_ms, 99)),
+        }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Run the benchmark sweep from the command line and write the JSON report.
+
+    Args:
+        argv (list[str] | None): the command line arguments, defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Per-stage frame benchmark for Alien Invasion")
+    parser.add_argument("--frames", type=int, default=120, help="frames measured per configuration")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the fleet layout")
+    parser.add_argument("--densities", type=int, nargs="+", default=[5, 25, 50, 100],
+                        help="fleet spawn chances to sweep")
+    parser.add_argument("--bullets", type=int, nargs="+", default=[5, 50, 200],
+                        help="bullet counts to sweep")
+    parser.add_argument("--fleet-backend", choices=["sprite", "numpy"], default="sprite",
+                        help="alien fleet backend to measure")
+    parser.add_argument("--output", default=None, help="write the report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = FrameBenchmark(args.frames, args.seed, args.fleet_backend).run(args.densities, args.bullets)
+    contents = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(contents)
+    else:
+        print(contents)
+
+
+if __name__ == '__main__':
+    main()
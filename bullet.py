@@ -1,7 +1,7 @@
 
-import pygame
 from pygame.sprite import Sprite
 from typing import TYPE_CHECKING
+from assets import load_image
 
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
@@ -16,44 +16,62 @@ class Bullet(Sprite):
     Args:
         Sprite (): The base class for all visible game objects in Pygame.
     """
-    def __init__(self, game: "AlienInvasion") -> None:
+    def __init__(self, game: "AlienInvasion", pool: list["Bullet"] | None = None) -> None:
         """
-        Initialize the bullet and set its starting position.
-        The bullet will be created at the ship's position and will move upwards on the screen.
+        Initialize the bullet.
+        The bullet is created inactive; it is placed at the ship's position by `activate` when it is fired.
 
         Args:
             game (AlienInvasion): The main game instance.   This will allow the bullet to access game settings and resources.            
+            pool (list[Bullet] | None): the free list the bullet returns to when it is retired.
         """
         super().__init__() 
         self.game = game
         self.settings = game.settings
         self.screen = game.screen
+        self.pool = pool
+        self.active = False
         
-        self.image = pygame.image.load(self.settings.bullet_file)
-        self.image = pygame.transform.scale(self.image, (self.settings.bullet_w, self.settings.bullet_h))
+        self.image = load_image(self.settings.bullet_file, (self.settings.bullet_w, self.settings.bullet_h))
         
         self.rect = self.image.get_rect()
-        self.rect.midtop = game.ship.rect.midtop
+        self.y = float(self.rect.y)
         
+    def activate(self, midtop: tuple[int, int]) -> None:
+        """
+        Place the bullet at the firing position and mark it as in flight.
+
+        Args:
+            midtop (tuple[int, int]): the position the bullet is fired from, usually the ship's midtop.
+        """
+        self.rect.midtop = midtop
         self.y = float(self.rect.y)
+        self.active = True
         
-    def update(self) -> None:
+    def kill(self) -> None:
+        """
+        Remove the bullet from all groups and return it to its pool so it can be fired again.
+        """
+        super().kill()
+        if self.active:
+            self.active = False
+            if self.pool is not None:
+                self.pool.append(self)
+        
+    def update(self, dt: float) -> None:
         """
         Update the position of the bullet.
         This method will be called in the game loop to ensure that the bullet moves upwards on the screen.
         The bullet's position will be updated based on the bullet speed defined in the game settings.
         The bullet will be removed from the arsenal if it goes off-screen.
+
+        Args:
+            dt (float): length of the simulation step in seconds.
         """
         # Move the bullet upwards
-        self.y -= self.settings.bullet_speed
+        self.y -= self.settings.bullet_speed * dt
         self.rect.y = self.y
         
-    def draw_bullet(self) -> None:
-        """
-        Draw the bullet on the screen.
-        This method will be called in the game loop to ensure that the bullet is drawn on the screen.
-        The bullet will be drawn on the screen using the rect attribute to determine its position.
-        """
-        # Draw the bullet on the screen
-        self.screen.blit(self.image, self.rect)
-        
+        # Retire the bullet once it has left the top of the screen
+        if self.rect.bottom <= 0:
+            self.kill()
@@ -1,4 +1,5 @@
 
+import pygame
 import pygame.font
 
 from typing import TYPE_CHECKING
@@ -40,12 +41,22 @@ class Button:
         self.msg_image_rect = self.msg_image.get_rect()
         self.msg_image_rect.center = self.rect.center
         
+        # Pre-compose the button and its message so it can be drawn with a single blit
+        self.image = pygame.Surface(self.rect.size)
+        self.image.fill(self.color)
+        self.image.blit(self.msg_image, self.msg_image_rect.move(-self.rect.x, -self.rect.y))
+        
     def draw_button(self) -> None:
         """
-        Draw the button and then draw the message.
+        Draw the button and its message, from the button's draw items.
+        """
+        self.screen.blits(self.get_draw_items(), doreturn=False)
+        
+    def get_draw_items(self) -> list:
+        """
+        Get the image and rect of the button for the renderer.
         """
-        self.screen.fill(self.settings.button_color, self.rect)
-        self.screen.blit(self.msg_image, self.msg_image_rect)
+        return [(self.image, self.rect)]
         
     def check_clicked(self, mouse_pos: tuple[int, int]) -> bool:
         """
@@ -0,0 +1,99 @@
+
+import pstats
+import cProfile
+from pathlib import Path
+from datetime import datetime
+
+
+class CaptureProfiler:
+    """
+    Runs cProfile over a window of game loop frames and writes the results.
+    A capture is either scheduled for a frame range up front or triggered during the game;
+    when it ends, a .pstats file and a text summary sorted by cumulative time are written.
+    """
+    def __init__(self, output_dir: Path, capture_frames: int, summary_lines: int = 40) -> None:
+        """
+        Initialize the capture profiler with no capture scheduled.
+
+        Args:
+            output_dir (Path): the folder the reports are written to.
+            capture_frames (int): number of frames a triggered capture covers.
+            summary_lines (int): number of functions listed in the text summary.
+        """
+        self.output_dir = output_dir
+        self.capture_frames = capture_frames
+        self.summary_lines = summary_lines
+        self.start_frame: int | None = None
+        self.end_frame: int | None = None
+        self.profile: cProfile.Profile | None = None
+        self.frame = 0
+        self.reports: list[Path] = []
+
+    def schedule(self, start_frame: int, end_frame: int) -> None:
+        """
+        Capture the frames from start_frame up to, but not including, end_frame.
+
+        Args:
+            start_frame (int): the first frame to profile, counted from the start of the run.
+            end_frame (int): the frame at which the capture stops.
+        """
+        if end_frame <= start_frame:
+            raise ValueError("The capture must end after it starts")
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+
+    def trigger(self) -> None:
+        """
+        Capture the next `capture_frames` frames, unless a capture is already running.
+        """
+        if self.profile is None:
+            self.schedule(self.frame + 1, self.frame + 1 + self.capture_frames)
+
+    def begin_frame(self, frame: int) -> None:
+        """
+        Start the scheduled capture if this is its first frame.
+
+        Args:
+            frame (int): the number of the frame that is starting.
+        """
+        self.frame = frame
+        if self.profile is None and frame == self.start_frame:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    def end_frame_reached(self, frame: int) -> None:
+        """
+        Stop the running capture and write its report once its last frame has run.
+
+        Args:
+            frame (int): the number of the frame that just ended.
+        """
+        if self.profile is not None and frame + 1 >= self.end_frame:
+            self.finish()
+
+    def finish(self) -> Path | None:
+        """
+        Stop the running capture, if any, and write its .pstats file and summary.
+
+        Returns:
+            Path | None: the .pstats file written, or None if no capture was running.
+        """
+        if self.profile is None:
+            return None
+        self.profile.disable()
+        profile = self.profile
+        self.profile = None
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        name = f"capture_{self.start_frame}-{self.frame}_{stamp}"
+        stats_path = self.output_dir / f"{name}.pstats"
+        profile.dump_stats(stats_path)
+        with open(self.output_dir / f"{name}.txt", "w") as summary:
+            stats = pstats.Stats(profile, stream=summary)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.summary_lines)
+
+        self.start_frame = self.end_frame = None
+        self.reports.append(stats_path)
+        print(f"Profile written to {stats_path}")
+        return stats_path
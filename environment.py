@@ -0,0 +1,219 @@
+
+import random
+import numpy as np
+import multiprocessing as mp
+from multiprocessing.connection import Connection
+from alien_invasion import AlienInvasion
+from observation import ObservationExporter
+
+# An action sets the ship's controls for one step: (moving_left, moving_right, fire)
+Action = tuple[bool, bool, bool]
+
+
+class AlienInvasionEnv:
+    """
+    Programmatic interface to a headless game for automated agents.
+    `reset` starts a new seeded game and `step` applies one action and advances the game by
+    one simulation step, returning the new observation, the score gained as the reward,
+    and whether the game is over because the last ship was lost.
+    """
+    def __init__(self, overrides: dict | None = None, render: bool = False, downsample: int = 1) -> None:
+        """
+        Initialize the environment and the headless game it runs.
+
+        Args:
+            overrides (dict | None): settings to set to fixed values, see Settings.override.
+            render (bool): draw every step, for observations that include the rendered frame.
+            downsample (int): keep every n-th pixel of every n-th row of the rendered frame.
+        """
+        self.game = AlienInvasion(headless=True, overrides=overrides)
+        self.render = render
+        self.exporter = ObservationExporter(self.game, downsample)
+        self.time_step = self.game.settings.time_step
+        self.score = 0
+
+    def reset(self, seed: int | None = None) -> dict:
+        """
+        Start a new game.
+
+        Args:
+            seed (int | None): seed for the game's random number generator, random if None.
+
+        Returns:
+            dict: the first observation of the new game.
+        """
+        game = self.game
+        game.seed = seed if seed is not None else random.randrange(2 ** 62)
+        game.rng.seed(game.seed)
+        # Cached formations were rolled from the previous seed
+        game.alien_fleet.formations.clear()
+        game.restart_game()
+        self.score = 0
+        if self.render:
+            self.exporter.render()
+        return self.observe()
+
+    def step(self, action: Action) -> tuple[dict, int, bool, dict]:
+        """
+        Apply an action and advance the game by one simulation step.
+        The ship can't fire during the pause after a lost ship or cleared level, like with
+        the keyboard. Once the game is over, steps leave it unchanged until the next reset.
+
+        Args:
+            action (Action): whether the ship moves left, moves right and fires.
+
+        Returns:
+            tuple[dict, int, bool, dict]: the observation, the score gained in the step,
+                whether the game is over, and the game's score, level and ships left.
+        """
+        game = self.game
+        if game.game_active:
+            moving_left, moving_right, fire = action
+            game.ship.moving_left = moving_left
+            game.ship.moving_right = moving_right
+            if fire and game.transition_action is None:
+                game.ship.fire()
+            game._update_simulation(self.time_step)
+            if self.render:
+                self.exporter.render()
+        stats = game.game_stats
+        reward = stats.score - self.score
+        self.score = stats.score
+        info = {"score": stats.score, "level": stats.level, "ships_left": stats.ships_left}
+        return self.observe(), reward, not game.game_active, info
+
+    def observe(self) -> dict:
+        """
+        Get the current state of the game.
+        The arrays are views of the exporter's arrays, overwritten by the next step.
+
+        Returns:
+            dict: the top-left positions of the ship, the aliens and the bullets, the ships left,
+                and the rendered RGB frame if the environment renders.
+        """
+        ship, aliens, bullets = self.exporter.export_state()
+        observation = {
+            "ship": ship,
+            "aliens": aliens,
+            "bullets": bullets,
+            "ships_left": self.game.game_stats.ships_left,
+            }
+        if self.render:
+            observation["frame"] = self.exporter.frame
+        return observation
+
+    def close(self) -> None:
+        """
+        Stop the game's background score writer.
+        """
+        self.game.game_stats.close()
+
+
+class VectorEnv:
+    """
+    Steps several games with one call, either one after another in this process or in parallel,
+    with each game in its own worker process connected by a pipe.
+    Games that are over keep returning done, with no reward, until they are reset.
+    In-process observations are views reused by the next step; worker observations arrive as copies.
+    """
+    def __init__(self, count: int, overrides: dict | None = None, render: bool = False,
+                 processes: bool = False, downsample: int = 1) -> None:
+        """
+        Initialize the games.
+
+        Args:
+            count (int): number of games.
+            overrides (dict | None): settings to set to fixed values in every game.
+            render (bool): draw every step.
+            processes (bool): run each game in its own worker process.
+            downsample (int): keep every n-th pixel of every n-th row of the rendered frames.
+        """
+        self.count = count
+        self.envs: list[AlienInvasionEnv] = []
+        self.connections: list[Connection] = []
+        self.workers: list[mp.Process] = []
+        if not processes:
+            self.envs = [AlienInvasionEnv(overrides, render, downsample) for _ in range(count)]
+            return
+        for _ in range(count):
+            connection, worker_connection = mp.Pipe()
+            worker = mp.Process(target=_run_worker, args=(worker_connection, overrides, render, downsample), daemon=True)
+            worker.start()
+            worker_connection.close()
+            self.connections.append(connection)
+            self.workers.append(worker)
+
+    def reset(self, seeds: list[int | None] | None = None) -> list[dict]:
+        """
+        Start a new game in every environment.
+
+        Args:
+            seeds (list[int | None] | None): a seed for each game, random if None.
+
+        Returns:
+            list[dict]: the first observation of each game.
+        """
+        if seeds is None:
+            seeds = [None] * self.count
+        if self.envs:
+            return [env.reset(seed) for env, seed in zip(self.envs, seeds)]
+        for connection, seed in zip(self.connections, seeds):
+            connection.send(("reset", seed))
+        return [connection.recv() for connection in self.connections]
+
+    def step(self, actions: list[Action]) -> tuple[list[dict], np.ndarray, np.ndarray, list[dict]]:
+        """
+        Apply one action to each game and advance all of them by one simulation step.
+
+        Args:
+            actions (list[Action]): an action for each game.
+
+        Returns:
+            tuple: the observations, the rewards and done flags as arrays, and the infos, one per game.
+        """
+        if self.envs:
+            results = [env.step(action) for env, action in zip(self.envs, actions)]
+        else:
+            for connection, action in zip(self.connections, actions):
+                connection.send(("step", action))
+            results = [connection.recv() for connection in self.connections]
+        observations, rewards, dones, infos = zip(*results)
+        return list(observations), np.array(rewards), np.array(dones), list(infos)
+
+    def close(self) -> None:
+        """
+        Close every game and stop the worker processes.
+        """
+        for env in self.envs:
+            env.close()
+        for connection in self.connections:
+            connection.send(("close", None))
+            connection.close()
+        for worker in self.workers:
+            worker.join()
+        self.envs = []
+        self.connections = []
+        self.workers = []
+
+
+def _run_worker(connection: Connection, overrides: dict | None, render: bool, downsample: int) -> None:
+    """
+    Run one environment in a worker process, answering the commands sent through the pipe.
+
+    Args:
+        connection (Connection): the worker's end of the pipe.
+        overrides (dict | None): settings to set to fixed values.
+        render (bool): draw every step.
+        downsample (int): keep every n-th pixel of every n-th row of the rendered frame.
+    """
+    env = AlienInvasionEnv(overrides, render, downsample)
+    while True:
+        command, argument = connection.recv()
+        if command == "reset":
+            connection.send(env.reset(argument))
+        elif command == "step":
+            connection.send(env.step(argument))
+        elif command == "close":
+            env.close()
+            connection.close()
+            return
@@ -0,0 +1,101 @@
+
+from time import perf_counter
+from collections import deque
+from typing import Any, Callable
+
+# Stages of the game loop shown in the profiler overlay, in loop order
+STAGES = ("events", "ship", "fleet", "collisions", "screen")
+
+
+class FrameProfiler:
+    """
+    Collects rolling per-stage timings of the game loop for the in-game profiler overlay.
+    While the profiler is disabled, `measure` just calls the stage, so the instrumentation
+    costs one extra function call per stage.
+    """
+    def __init__(self, window: int = 120) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            window (int): number of recent frames the rolling timings are averaged over.
+        """
+        self.enabled = False
+        self.window = window
+        self.current = dict.fromkeys(STAGES, 0.0)
+        self.stage_times = {stage: deque(maxlen=window) for stage in STAGES}
+        self.frame_times: deque[float] = deque(maxlen=window)
+        self.last_frame_end: float | None = None
+
+    def toggle(self) -> None:
+        """
+        Switch the profiler on or off. Turning it on starts from empty timings.
+        """
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.reset()
+
+    def reset(self) -> None:
+        """
+        Drop all collected timings.
+        """
+        self.current = dict.fromkeys(STAGES, 0.0)
+        for times in self.stage_times.values():
+            times.clear()
+        self.frame_times.clear()
+        self.last_frame_end = None
+
+    def measure(self, stage: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call a stage of the game loop, adding its run time to the current frame when enabled.
+        A stage that runs several times in one frame, like a catch-up simulation step, is summed.
+
+        Args:
+            stage (str): the stage name, one of STAGES.
+            func (Callable): the stage to run.
+            *args: the arguments passed to func.
+
+        Returns:
+            Any: the value returned by func.
+        """
+        if not self.enabled:
+            return func(*args)
+        start = perf_counter()
+        result = func(*args)
+        self.current[stage] += perf_counter() - start
+        return result
+
+    def end_frame(self) -> None:
+        """
+        Store the current frame's stage timings and the time since the previous frame ended.
+        """
+        if not self.enabled:
+            return
+        now = perf_counter()
+        if self.last_frame_end is not None:
+            self.frame_times.append(now - self.last_frame_end)
+        self.last_frame_end = now
+        for stage, seconds in self.current.items():
+            self.stage_times[stage].append(seconds)
+            self.current[stage] = 0.0
+
+    def get_stage_means(self) -> dict[str, float]:
+        """
+        Get the rolling mean of each stage.
+
+        Returns:
+            dict[str, float]: mean seconds per frame of each stage.
+        """
+        return {stage: sum(times) / len(times) if times else 0.0
+                for stage, times in self.stage_times.items()}
+
+    def get_fps(self) -> float:
+        """
+        Get the rolling frame rate.
+
+        Returns:
+            float: frames per second over the rolling window, 0 if no frames were measured.
+        """
+        if not self.frame_times:
+            return 0.0
+        return len(self.frame_times) / sum(self.frame_times)
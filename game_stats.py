@@ -1,5 +1,6 @@
 
 import json
+from score_writer import ScoreWriter
 
 from typing import TYPE_CHECKING
 
@@ -29,6 +30,7 @@ class GameStats:
         if the file exists, otherwise setting the high score to 0 and saving the scores.
         """
         self.path = self.settings.scores_file
+        self.writer = ScoreWriter(self.path, self.settings.scores_flush_interval)
         if self.path.exists() and self.path.stat.__sizeof__() > 21:
             contents = self.path.read_text()
             scores = json.loads(contents)
@@ -39,18 +41,37 @@ class GameStats:
             
     
     
-    def save_scores(self) -> None:
+    def _get_scores(self) -> dict:
         """
-        The function `save_scores` saves the high score data to a file in JSON format.
+        The function returns the score data that is saved to the scores file.
         """
-        scores = {
+        return {
             "hi_score": self.hi_score,
             }
-        contents = json.dumps(scores, indent=4)
-        try:
-            self.path.write_text(contents)
-        except FileNotFoundError as e:
-            print(f"File not found: {e}")
+    
+    def save_scores(self) -> None:
+        """
+        The function `save_scores` saves the high score data to a file in JSON format right away.
+        Headless runs never write scores, so benchmark sessions don't overwrite the player's hi score.
+        """
+        if self.game.headless:
+            return
+        self.writer.write(self._get_scores())
+        
+    def _mark_scores_dirty(self) -> None:
+        """
+        The function hands the current scores to the background writer, which saves them
+        after a short delay instead of writing to disk inside the game loop.
+        """
+        if self.game.headless:
+            return
+        self.writer.submit(self._get_scores())
+        
+    def close(self) -> None:
+        """
+        The function stops the background writer and saves any scores it has not written yet.
+        """
+        self.writer.close()
                     
                 
     def reset_stats(self):
@@ -88,7 +109,7 @@ class GameStats:
         """
         if self.score > self.hi_score:
             self.hi_score = self.score
-            self.save_scores()            
+            self._mark_scores_dirty()            
 
     def _update_score(self, collisions):
         """
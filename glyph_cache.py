@@ -0,0 +1,63 @@
+
+import pygame
+import pygame.font
+
+# Glyphs rendered up front, so score updates never rasterize a character
+DIGITS = "0123456789,.- "
+
+
+class GlyphCache:
+    """
+    Renders text by composing cached single-character surfaces for one font and color.
+    Each character is rasterized by the font only the first time it is used; after that,
+    text is built by blitting the cached glyphs side by side.
+    """
+    def __init__(self, font: pygame.font.Font, color: tuple[int, int, int]) -> None:
+        """
+        Initialize the cache and pre-render the digit glyphs.
+
+        Args:
+            font (pygame.font.Font): the font the glyphs are rendered with.
+            color (tuple[int, int, int]): the text color.
+        """
+        self.font = font
+        self.color = color
+        self.glyphs: dict[str, pygame.Surface] = {}
+        for char in DIGITS:
+            self.get_glyph(char)
+
+    def get_glyph(self, char: str) -> pygame.Surface:
+        """
+        Get the surface for a single character, rendering it the first time it is used.
+
+        Args:
+            char (str): the character.
+
+        Returns:
+            pygame.Surface: the rendered character.
+        """
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.font.render(char, True, self.color, None)
+            self.glyphs[char] = glyph
+        return glyph
+
+    def render(self, text: str) -> pygame.Surface:
+        """
+        Compose the text from cached glyphs into a new transparent surface.
+
+        Args:
+            text (str): the text to render.
+
+        Returns:
+            pygame.Surface: the composed text.
+        """
+        glyphs = [self.get_glyph(char) for char in text]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        height = max((glyph.get_height() for glyph in glyphs), default=self.font.get_height())
+        image = pygame.Surface((max(width, 1), height), pygame.SRCALPHA)
+        x = 0
+        for glyph in glyphs:
+            image.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        return image
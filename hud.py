@@ -1,5 +1,9 @@
 
+import pygame
 import pygame.font    
+from time import perf_counter
+from assets import load_image
+from glyph_cache import GlyphCache
 class HUD:
     """
     manages and displays various game statistics and visuals such as scores,
@@ -18,7 +22,24 @@ class HUD:
         self.boundaries = game.screen.get_rect()
         self.game_stats = game.game_stats
         self.font = pygame.font.Font(self.settings.HUD_font_file, self.settings.HUD_font_size)
+        self.text = GlyphCache(self.font, self.settings.HUD_font_color)
         self.padding = 20
+        self.countdown_str = ""
+        self.countdown_image = None
+        
+        # Frame profiler overlay, redrawn every `profiler_refresh` seconds while it is on
+        self.profiler = game.profiler
+        self.profiler_font = pygame.font.Font(self.settings.HUD_font_file, self.settings.profiler_font_size)
+        self.profiler_text = GlyphCache(self.profiler_font, self.settings.HUD_font_color)
+        self.profiler_image = None
+        self.profiler_updated = 0.0
+        
+        # Last rendered text of each field; a field is only re-rendered when its text changes
+        self.score_str = self.max_score_str = self.hi_score_str = self.level_str = None
+        self.score_rect = pygame.Rect(0, 0, 0, 0)
+        self.max_score_rect = pygame.Rect(0, 0, 0, 0)
+        self.hi_score_rect = pygame.Rect(0, 0, 0, 0)
+        self.level_rect = pygame.Rect(0, 0, 0, 0)
         self.update_scores()
         self._setup_life_image()
         self.update_level()
@@ -27,13 +48,13 @@ class HUD:
         """
         loads an image, scales it, and gets its rectangle for use as indicator of lives left
         """
-        self.life_image = pygame.image.load(self.settings.ship_file)
-        self.life_image = pygame.transform.scale(self.life_image, (self.settings.ship_w, self.settings.ship_h))
+        self.life_image = load_image(self.settings.ship_file, (self.settings.ship_w, self.settings.ship_h))
         self.life_rect = self.life_image.get_rect()
     
     def update_scores(self) -> None:
         """
         function updates the maximum score, score, and high score.
+        Only the fields whose values changed are re-rendered.
         """
         self._update_max_score()
         self._update_score()
@@ -44,60 +65,170 @@ class HUD:
         updates the score display in a game interface.
         """
         score_str = f"Score: {self.game_stats.score: ,.0f}"
-        self.score_image = self.font.render(score_str, True, self.settings.HUD_font_color, None)
-        self.score_rect = self.score_image.get_rect()
-        self.score_rect.right = self.boundaries.right - self.padding
-        self.score_rect.top = self.max_score_rect.bottom + self.padding             
+        if score_str == self.score_str:
+            return
+        self.score_str = score_str
+        self.score_image = self.text.render(score_str)
+        if self.score_image.get_width() != self.score_rect.width:
+            self.score_rect = self.score_image.get_rect()
+            self.score_rect.right = self.boundaries.right - self.padding
+            self.score_rect.top = self.max_score_rect.bottom + self.padding             
         
     def _update_max_score(self) -> None:
         """
         The function renders and positions the maximum score text on the game screen.
         """
         max_score_str = f"Max-Score: {self.game_stats.max_score: ,.0f}"
-        self.max_score_image = self.font.render(max_score_str, True, self.settings.HUD_font_color, None)
-        self.max_score_rect = self.max_score_image.get_rect()
-        self.max_score_rect.right = self.boundaries.right - self.padding
-        self.max_score_rect.top = self.padding
+        if max_score_str == self.max_score_str:
+            return
+        self.max_score_str = max_score_str
+        self.max_score_image = self.text.render(max_score_str)
+        if self.max_score_image.get_width() != self.max_score_rect.width:
+            self.max_score_rect = self.max_score_image.get_rect()
+            self.max_score_rect.right = self.boundaries.right - self.padding
+            self.max_score_rect.top = self.padding
         
     def _update_hi_score(self) -> None:
         """
         The function updates the high score display in a game interface.
         """
         hi_score_str = f"Hi-Score: {self.game_stats.hi_score: ,.0f}"
-        self.hi_score_image = self.font.render(hi_score_str, True, self.settings.HUD_font_color, None)
-        self.hi_score_rect = self.hi_score_image.get_rect()
-        self.hi_score_rect.midtop = (self.boundaries.centerx, self.padding)        
+        if hi_score_str == self.hi_score_str:
+            return
+        self.hi_score_str = hi_score_str
+        self.hi_score_image = self.text.render(hi_score_str)
+        if self.hi_score_image.get_width() != self.hi_score_rect.width:
+            self.hi_score_rect = self.hi_score_image.get_rect()
+            self.hi_score_rect.midtop = (self.boundaries.centerx, self.padding)        
         
     def update_level(self) -> None:
         """
         function updates the difficulty level display on the game screen with the current level information.
         """
         level_str = f"Level: {self.game_stats.level: ,.0f}"
-        self.level_image = self.font.render(level_str, True, self.settings.HUD_font_color, None)
-        self.level_rect = self.level_image.get_rect()
-        self.level_rect.left = self.padding
-        self.level_rect.top = self.life_rect.bottom + self.padding
+        if level_str == self.level_str:
+            return
+        self.level_str = level_str
+        self.level_image = self.text.render(level_str)
+        if self.level_image.get_width() != self.level_rect.width:
+            self.level_rect = self.level_image.get_rect()
+            self.level_rect.left = self.padding
+            self.level_rect.top = self.life_rect.bottom + self.padding
+        
+    def update_countdown(self, message: str, remaining: float) -> None:
+        """
+        The function renders the pause message and the remaining seconds in the middle of the screen,
+        re-rendering only when the displayed text changes.
+        
+        :param message: text shown before the countdown, e.g. "Ship lost".
+        :param remaining: seconds left in the pause.
+        """
+        countdown_str = f"{message}  {remaining:.1f}"
+        if countdown_str == self.countdown_str:
+            return
+        self.countdown_str = countdown_str
+        self.countdown_image = self.text.render(countdown_str)
+        self.countdown_rect = self.countdown_image.get_rect()
+        self.countdown_rect.center = self.boundaries.center
         
-    def draw_lives(self) -> None:
+    def clear_countdown(self) -> None:
         """
-        The function draws a certain number of life images on the screen based on
-        the number of ships left in the game statistics.
+        The function hides the pause countdown.
         """
+        self.countdown_str = ""
+        self.countdown_image = None
+        
+    def _update_profiler_overlay(self) -> None:
+        """
+        The function redraws the profiler overlay with the FPS, the rolling stage timings, the
+        alien and bullet counts and a frame-time graph, at most once per `profiler_refresh` seconds.
+        """
+        if not self.profiler.enabled:
+            self.profiler_image = None
+            return
+        now = perf_counter()
+        if self.profiler_image is not None and now - self.profiler_updated < self.settings.profiler_refresh:
+            return
+        self.profiler_updated = now
+        
+        lines = [f"FPS {self.profiler.get_fps():.1f}"]
+        for stage, seconds in self.profiler.get_stage_means().items():
+            lines.append(f"{stage} {seconds * 1000:.2f} ms")
+        lines.append(f"aliens {len(self.game.alien_fleet.fleet)}  bullets {len(self.game.ship.arsenal.arsenal)}")
+        line_images = [self.profiler_text.render(line) for line in lines]
+        
+        graph_w = self.settings.profiler_window * 2
+        graph_h = 60
+        line_h = self.profiler_font.get_linesize()
+        width = max(graph_w, *(image.get_width() for image in line_images)) + self.padding
+        height = line_h * len(line_images) + graph_h + self.padding * 3 // 2
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        image.fill(self.settings.profiler_color)
+        
+        y = self.padding // 2
+        for line_image in line_images:
+            image.blit(line_image, (self.padding // 2, y))
+            y += line_h
+        self._draw_frame_graph(image, pygame.Rect(self.padding // 2, y + self.padding // 2, graph_w, graph_h))
+        
+        self.profiler_image = image
+        self.profiler_rect = image.get_rect()
+        self.profiler_rect.bottomleft = (self.padding, self.boundaries.bottom - self.padding)
+        
+    def _draw_frame_graph(self, image: pygame.Surface, area: pygame.Rect) -> None:
+        """
+        The function draws one bar per recent frame time, scaled so the frame budget is at half height,
+        with a line marking the budget.
+        
+        :param image: the overlay surface to draw on.
+        :param area: the part of the overlay the graph fills.
+        """
+        budget = 1 / self.settings.FPS if self.settings.FPS else self.settings.time_step
+        bar_w = area.width // self.settings.profiler_window
+        x = area.left
+        for frame_time in self.profiler.frame_times:
+            bar_h = min(area.height, round(frame_time / budget * area.height / 2))
+            color = (90, 220, 90) if frame_time <= budget else (240, 80, 60)
+            image.fill(color, (x, area.bottom - bar_h, bar_w, bar_h))
+            x += bar_w
+        budget_y = area.bottom - area.height // 2
+        pygame.draw.line(image, self.settings.HUD_font_color, (area.left, budget_y), (area.right, budget_y))
+        
+    def _get_life_rects(self) -> list:
+        """
+        The function returns the rectangles of the life images for the number of ships left.
+        """
+        life_rects = []
         current_x = self.padding
         current_y = self.padding
         for _ in range(self.game_stats.ships_left):
-            self.screen.blit(self.life_image, (current_x, current_y))
-            current_x += self.life_rect.width + self.padding      
+            life_rects.append(self.life_rect.move(current_x, current_y))
+            current_x += self.life_rect.width + self.padding
+        return life_rects
+        
+    def get_draw_items(self) -> list:
+        """
+        function returns the images and rectangles of the HUD, as (image, rect) pairs in drawing order.
+        """
+        items = [
+            (self.hi_score_image, self.hi_score_rect),
+            (self.max_score_image, self.max_score_rect),
+            (self.score_image, self.score_rect),
+            (self.level_image, self.level_rect),
+            ]
+        items += [(self.life_image, rect) for rect in self._get_life_rects()]
+        if self.countdown_image is not None:
+            items.append((self.countdown_image, self.countdown_rect))
+        self._update_profiler_overlay()
+        if self.profiler_image is not None:
+            items.append((self.profiler_image, self.profiler_rect))
+        return items
         
     def draw(self) -> None:
         """
-        function blits several images onto the screen including high
-        score, max score, current score, and level images, as well as calls the `draw_lives` method.
+        function blits the images returned by `get_draw_items` onto the screen: the high score,
+        max score, current score, level and life images, the countdown and the profiler overlay.
         """
-        self.screen.blit(self.hi_score_image, self.hi_score_rect)   
-        self.screen.blit(self.max_score_image, self.max_score_rect)   
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
-        self.draw_lives()   
+        self.screen.blits(self.get_draw_items(), doreturn=False)
         
         
\ No newline at end of file
@@ -0,0 +1,96 @@
+
+import struct
+from pathlib import Path
+
+# File layout: header, then one record per frame followed by that frame's input events
+MAGIC = b"AIREC1"
+HEADER = struct.Struct("<6sq")   # magic, RNG seed
+FRAME = struct.Struct("<BB")     # simulation steps run in the frame, number of input events
+EVENT = struct.Struct("<BI")     # event kind, key code
+
+# Event kinds
+KEYDOWN = 0
+KEYUP = 1
+RESTART = 2
+
+
+class InputRecorder:
+    """
+    Records the input a game session receives, frame by frame, in a compact binary file.
+    Each frame stores how many simulation steps it ran and the key presses, key releases and
+    game restarts that were dispatched before those steps, which together with the RNG seed
+    is enough to reproduce the session.
+    """
+    def __init__(self, path: Path, seed: int) -> None:
+        """
+        Initialize the recorder with an empty recording.
+
+        Args:
+            path (Path): the file the recording is written to.
+            seed (int): the seed of the game's random number generator.
+        """
+        self.path = path
+        self.data = bytearray(HEADER.pack(MAGIC, seed))
+        self.events: list[tuple[int, int]] = []
+
+    def record_key(self, kind: int, key: int) -> None:
+        """
+        Record a key press or release dispatched to the game.
+
+        Args:
+            kind (int): KEYDOWN or KEYUP.
+            key (int): the pygame key code.
+        """
+        self.events.append((kind, key))
+
+    def record_restart(self) -> None:
+        """
+        Record that a new game was started.
+        """
+        self.events.append((RESTART, 0))
+
+    def end_frame(self, steps: int) -> None:
+        """
+        Store the current frame with the events recorded since the previous frame.
+
+        Args:
+            steps (int): the number of simulation steps the frame ran.
+        """
+        self.data += FRAME.pack(steps, len(self.events))
+        for kind, key in self.events:
+            self.data += EVENT.pack(kind, key)
+        self.events.clear()
+
+    def save(self) -> None:
+        """
+        Write the recording to its file.
+        """
+        self.path.write_bytes(self.data)
+
+
+class InputReplay:
+    """
+    Reads a recording made by InputRecorder.
+    """
+    def __init__(self, path: Path) -> None:
+        """
+        Load and decode a recording.
+
+        Args:
+            path (Path): the recording file.
+        """
+        data = Path(path).read_bytes()
+        magic, self.seed = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an Alien Invasion input recording")
+
+        self.frames: list[tuple[int, list[tuple[int, int]]]] = []
+        offset = HEADER.size
+        while offset < len(data):
+            steps, count = FRAME.unpack_from(data, offset)
+            offset += FRAME.size
+            events = []
+            for _ in range(count):
+                events.append(EVENT.unpack_from(data, offset))
+                offset += EVENT.size
+            self.frames.append((steps, events))
@@ -0,0 +1,159 @@
+
+import time
+import numpy as np
+from time import perf_counter
+
+# Kinds of input whose latency is measured
+INPUT_KINDS = ("keydown", "keyup")
+
+
+class LatencyTracker:
+    """
+    Measures input-to-photon latency: the time from when a key press or release is taken
+    from the event queue until the first frame showing its effect is presented.
+    An input takes effect in the first simulation step after it was dispatched, so it is
+    counted as presented by the first display flip after that step; inputs received on a
+    frame that simulates nothing keep waiting for the next frame that does. Inputs still
+    waiting when the game stops running are dropped, as nothing shows their effect.
+    Time an event spends in the queue before it is read is not visible to the game.
+    """
+    def __init__(self, max_ms: float = 100.0, bin_ms: float = 2.0) -> None:
+        """
+        Initialize the tracker with no samples.
+
+        Args:
+            max_ms (float): upper end of the histogram range; slower samples go in an overflow bin.
+            bin_ms (float): width of a histogram bin.
+        """
+        self.edges = np.append(np.arange(0.0, max_ms + bin_ms / 2, bin_ms), np.inf)
+        self.waiting: list[tuple[str, float]] = []
+        self.simulated: list[tuple[str, float]] = []
+        self.samples: dict[str, list[float]] = {kind: [] for kind in INPUT_KINDS}
+
+    def input_received(self, kind: str, timestamp: float | None = None) -> None:
+        """
+        Start timing an input.
+
+        Args:
+            kind (str): "keydown" or "keyup".
+            timestamp (float | None): perf_counter time the input was read, now if None.
+        """
+        self.waiting.append((kind, perf_counter() if timestamp is None else timestamp))
+
+    def step_simulated(self) -> None:
+        """
+        Mark the inputs received so far as applied by a simulation step.
+        """
+        self.simulated += self.waiting
+        self.waiting.clear()
+
+    def discard_waiting(self) -> None:
+        """
+        Drop the inputs that no simulation step has applied yet, when the game stops running.
+        """
+        self.waiting.clear()
+
+    def frame_presented(self) -> None:
+        """
+        Record the latency of every applied input, now that a frame showing them was presented.
+        """
+        now = perf_counter()
+        for kind, timestamp in self.simulated:
+            self.samples[kind].append((now - timestamp) * 1000)
+        self.simulated.clear()
+
+    def get_histogram(self, kind: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the latency histogram of one kind of input.
+
+        Args:
+            kind (str): "keydown" or "keyup".
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: the sample count of each bin and the bin edges in
+                milliseconds, the last bin holding every sample over the histogram range.
+        """
+        counts, _ = np.histogram(self.samples[kind], bins=self.edges)
+        return counts, self.edges
+
+    def report(self) -> dict:
+        """
+        Summarize the latency of each kind of input.
+
+        Returns:
+            dict: sample count, mean, median, 95th and 99th percentile and maximum in
+                milliseconds for each kind of input that has samples.
+        """
+        summary = {}
+        for kind, samples in self.samples.items():
+            if not samples:
+                continue
+            samples_ms = np.asarray(samples)
+            summary[kind] = {
+                "count": len(samples),
+                "mean_ms": float(samples_ms.mean()),
+                "p50_ms": float(np.percentile(samples_ms, 50)),
+                "p95_ms": float(np.percentile(samples_ms, 95)),
+                "p99_ms": float(np.percentile(samples_ms, 99)),
+                "max_ms": float(samples_ms.max()),
+                }
+        return summary
+
+    def format_report(self, width: int = 40) -> str:
+        """
+        Format the latency summary and histograms as text, leaving out empty bins.
+
+        Args:
+            width (int): characters of the longest histogram bar.
+
+        Returns:
+            str: the report.
+        """
+        lines = []
+        for kind, stats in self.report().items():
+            lines.append(f"{kind}: {stats['count']} inputs, mean {stats['mean_ms']:.1f} ms, "
+                         f"p50 {stats['p50_ms']:.1f} ms, p95 {stats['p95_ms']:.1f} ms, "
+                         f"p99 {stats['p99_ms']:.1f} ms, max {stats['max_ms']:.1f} ms")
+            counts, edges = self.get_histogram(kind)
+            largest = counts.max()
+            for count, low, high in zip(counts, edges[:-1], edges[1:]):
+                if count:
+                    label = f"{low:5.0f}+    ms" if np.isinf(high) else f"{low:5.0f}-{high:<4.0f}ms"
+                    lines.append(f"  {label} {'#' * max(1, round(width * count / largest))} {count}")
+        return "\n".join(lines) if lines else "No input latency samples"
+
+
+class FramePacer:
+    """
+    Caps the frame rate by waiting for each frame's start time before the frame reads input.
+    The wait sleeps until shortly before the start time and spins for the rest, so frames
+    start on time instead of late by the sleep granularity, like with pygame's Clock.tick.
+    A frame that starts late resets the cadence instead of rushing the following frames.
+    """
+    def __init__(self, fps: int, spin_time: float = 0.002) -> None:
+        """
+        Initialize the pacer.
+
+        Args:
+            fps (int): frames per second, 0 to never wait.
+            spin_time (float): seconds before the start time at which sleeping turns into spinning.
+        """
+        self.period = 1 / fps if fps else 0.0
+        self.spin_time = spin_time
+        self.next_start: float | None = None
+
+    def wait(self) -> None:
+        """
+        Wait until the next frame may start.
+        """
+        if not self.period:
+            return
+        now = perf_counter()
+        if self.next_start is not None and now < self.next_start:
+            sleep_time = self.next_start - now - self.spin_time
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            while perf_counter() < self.next_start:
+                pass
+            now = self.next_start
+        self.next_start = now + self.period
@@ -0,0 +1,279 @@
+
+import pygame
+import numpy as np
+from alien import Alien
+from alien_fleet import AlienFleet
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class NumpyAlien(Alien):
+    """
+    Alien of a NumpyAlienFleet. Its position lives in the fleet's arrays, and its rect is
+    only moved there when it is read, so moving the fleet never touches the aliens.
+    """
+    def __init__(self, fleet: "NumpyAlienFleet", x: float, y: float, index: int) -> None:
+        """
+        Initialize the alien and remember its index into the fleet arrays.
+
+        Args:
+            fleet (NumpyAlienFleet): the fleet the alien belongs to.
+            x (float): x-coordinate of the alien.
+            y (float): y-coordinate of the alien.
+            index (int): the alien's index into the fleet arrays.
+        """
+        self.index = index
+        super().__init__(fleet, x, y)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """
+        The alien's rect at its current position in the fleet arrays, rounded like the rect
+        of a sprite fleet alien. Before the arrays are built, the rect is left where it was placed.
+        """
+        rect = self._rect
+        fleet = self.fleet
+        if self.index < len(fleet.x):
+            rect.topleft = (round(fleet.x[self.index]), round(fleet.y[self.index]))
+        return rect
+
+    @rect.setter
+    def rect(self, rect: pygame.Rect) -> None:
+        self._rect = rect
+
+
+class NumpyAlienFleet(AlienFleet):
+    """
+    Alien fleet that keeps the alien positions in NumPy arrays.
+    The whole fleet is moved, edge-checked, dropped and bottom-checked with a few array
+    operations per frame, and collisions are box-overlap tests over the arrays. Alien rects
+    are only synced from the arrays when something reads them, and drawing takes the
+    positions straight from the arrays.
+    """
+    def __init__(self, game: "AlienInvasion") -> None:
+        """
+        Initialize the fleet arrays before the parent class creates the first fleet.
+
+        Args:
+            game (AlienInvasion): The main game instance.
+        """
+        self.aliens: list[Alien] = []
+        self.x = np.empty(0, dtype=float)
+        self.y = np.empty(0, dtype=float)
+        self.alive = np.empty(0, dtype=bool)
+        self.x_order = np.empty(0, dtype=int)
+        self.x_sorted = np.empty(0, dtype=float)
+        super().__init__(game)
+
+    def createFleet(self) -> None:
+        """
+        Create the alien fleet with the parent class, then build the position arrays from it.
+        """
+        # Empty arrays leave the new aliens' rects where they are placed until the arrays are built
+        self.aliens = []
+        self.x = np.empty(0, dtype=float)
+        self.y = np.empty(0, dtype=float)
+        super().createFleet()
+        self._build_arrays()
+
+    def _create_alien(self, current_x: int, current_y: int):
+        """
+        Create a new alien, add it to the fleet and remember its index into the fleet arrays.
+
+        Args:
+            current_x (int): the x-coordinate for the alien's position
+            current_y (int): the y-coordinate for the alien's position
+        """
+        new_alien = NumpyAlien(self, current_x, current_y, len(self.aliens))
+        self.aliens.append(new_alien)
+        self.fleet.add(new_alien)
+
+    def _build_arrays(self) -> None:
+        """
+        Build the x, y and alive arrays from the aliens created for the current fleet.
+        """
+        self.x = np.array([alien.x for alien in self.aliens], dtype=float)
+        self.y = np.array([alien.y for alien in self.aliens], dtype=float)
+        self.alive = np.ones(len(self.aliens), dtype=bool)
+        # The fleet moves as one block, so the order of the aliens by x never changes
+        self.x_order = np.argsort(self.x, kind="stable")
+        self.x_sorted = self.x[self.x_order]
+
+    def _check_fleet_edges(self) -> bool:
+        """
+        Check if the leftmost or rightmost living alien has reached the edge of the screen.
+        If so, change the fleet's direction and drop the fleet down.
+
+        Returns:
+            bool: True if the fleet dropped, False otherwise.
+        """
+        if self.leftmost is None:
+            return False
+        left_x = self.x[self.leftmost.index]
+        right_x = self.x[self.rightmost.index]
+        if right_x + self.settings.alien_w >= self.settings.screen_w or left_x <= 0:
+            self._drop_alien_fleet()
+            self.fleet_direction *= -1
+            return True
+        return False
+
+    def _drop_alien_fleet(self) -> None:
+        """
+        Drop the entire fleet down by a specified amount.
+        """
+        self.y += self.fleet_drop_speed
+
+    def update_fleet(self, dt: float) -> None:
+        """
+        Update the position of the fleet based on the fleet direction.
+
+        Args:
+            dt (float): length of the simulation step in seconds.
+        """
+        dropped = self._check_fleet_edges()
+        self.x += self.settings.fleet_speed * dt * self.fleet_direction
+        self._record_step(dt, dropped)
+
+    def get_draw_items(self, alpha: float = 1.0) -> list:
+        """
+        Get the images and rects of all living aliens, positioned straight from the arrays.
+
+        Args:
+            alpha (float): interpolation between the previous and the current simulation step.
+
+        Returns:
+            list: (image, rect) pairs in drawing order.
+        """
+        if self.settings.fleet_render_mode == "composite":
+            return super().get_draw_items(alpha)
+        offset_x, offset_y = self.get_render_offset(alpha)
+        index = np.flatnonzero(self.alive)
+        rect_x = (np.rint(self.x[index]).astype(int) + offset_x).tolist()
+        rect_y = (np.rint(self.y[index]).astype(int) + offset_y).tolist()
+        alien_w = self.settings.alien_w
+        alien_h = self.settings.alien_h
+        aliens = self.aliens
+        return [(aliens[i].image, pygame.Rect(x, y, alien_w, alien_h))
+                for i, x, y in zip(index.tolist(), rect_x, rect_y)]
+
+    def _find_hits(self, rects: list[pygame.Rect]) -> list[tuple[int, int]]:
+        """
+        Find the alien each rect hits, testing all the rects against the fleet arrays at once.
+        Rects below the fleet are skipped, and each remaining rect is only tested against the
+        aliens in the columns it overlaps, found by a binary search of the aliens sorted by x.
+        A rect that overlaps several aliens hits the one with the lowest index, which is the
+        one added to the fleet first, the same alien groupcollide would pick.
+
+        Args:
+            rects (list[pygame.Rect]): the areas to test, such as the rects of the bullets.
+
+        Returns:
+            list[tuple[int, int]]: the index of each rect that hit an alien and the index of
+                the alien it hit, in the order of the rects.
+        """
+        if self.lowest is None or not rects:
+            return []
+        alien_w = self.settings.alien_w
+        alien_h = self.settings.alien_h
+        boxes = np.array([tuple(rect) for rect in rects], dtype=float).reshape(-1, 4)
+        candidates = np.flatnonzero(boxes[:, 1] < round(self.y[self.lowest.index]) + alien_h)
+        if not len(candidates):
+            return []
+        left_b = boxes[candidates, 0]
+        top_b = boxes[candidates, 1]
+        right_b = left_b + boxes[candidates, 2]
+        bottom_b = top_b + boxes[candidates, 3]
+        
+        # Aliens whose unrounded x is within a pixel of overlapping each rect, from the sorted order
+        shift = self.x[self.x_order[0]] - self.x_sorted[0]
+        low = np.searchsorted(self.x_sorted, left_b - alien_w - 1 - shift, side="left")
+        high = np.searchsorted(self.x_sorted, right_b + 1 - shift, side="right")
+        counts = high - low
+        total = int(counts.sum())
+        if not total:
+            return []
+        rect_of_pair = np.repeat(np.arange(len(candidates)), counts)
+        first_pair = np.cumsum(counts) - counts
+        alien_of_pair = self.x_order[np.arange(total) + np.repeat(low - first_pair, counts)]
+        
+        left = np.rint(self.x[alien_of_pair])
+        top = np.rint(self.y[alien_of_pair])
+        hit = (self.alive[alien_of_pair]
+               & (left < right_b[rect_of_pair]) & (left + alien_w > left_b[rect_of_pair])
+               & (top < bottom_b[rect_of_pair]) & (top + alien_h > top_b[rect_of_pair]))
+        rect_of_pair = rect_of_pair[hit]
+        alien_of_pair = alien_of_pair[hit]
+        if not len(rect_of_pair):
+            return []
+        
+        # Keep the lowest alien index of each rect
+        order = np.lexsort((alien_of_pair, rect_of_pair))
+        rect_of_pair = rect_of_pair[order]
+        alien_of_pair = alien_of_pair[order]
+        first = np.ones(len(rect_of_pair), dtype=bool)
+        first[1:] = rect_of_pair[1:] != rect_of_pair[:-1]
+        return list(zip(candidates[rect_of_pair[first]].tolist(), alien_of_pair[first].tolist()))
+
+    def _collide_nearby(self, other_group) -> dict:
+        """
+        Check the sprites of the other group against the fleet arrays, removing the sprites
+        that hit and the aliens that were hit.
+
+        Args:
+            other_group (pygame.sprite.Group): The other group of sprites to check for collisions with.
+
+        Returns:
+            dict: the aliens that were hit, mapped to the list of sprites that hit them.
+        """
+        sprites = other_group.sprites()
+        collisions = {}
+        for sprite_index, alien_index in self._find_hits([sprite.rect for sprite in sprites]):
+            sprite = sprites[sprite_index]
+            collisions.setdefault(self.aliens[alien_index], []).append(sprite)
+            sprite.kill()
+        for alien in collisions:
+            alien.kill()
+        return collisions
+
+    def spritecollideany(self, sprite) -> "Alien | None":
+        """
+        Find an alien that collides with the given sprite, testing the fleet arrays.
+
+        Args:
+            sprite (Sprite): the sprite to test against the fleet, such as the player's ship.
+
+        Returns:
+            Alien | None: the first colliding alien, or None if there is no collision.
+        """
+        if not self.settings.use_spatial_hash:
+            return super().spritecollideany(sprite)
+        hits = self._find_hits([sprite.rect])
+        return self.aliens[hits[0][1]] if hits else None
+
+    def check_collisions(self, other_group) -> dict:
+        """
+        Check for collisions with another group of sprites and mark the destroyed aliens as dead.
+
+        Args:
+            other_group (pygame.sprite.Group): The other group of sprites to check for collisions with.
+
+        Returns:
+            dict: the aliens that were hit, mapped to the sprites that hit them.
+        """
+        collisions = super().check_collisions(other_group)
+        for alien in collisions:
+            self.alive[alien.index] = False
+        return collisions
+
+    def check_fleet_bottom(self) -> bool:
+        """
+        Check if the lowest living alien has reached the bottom of the screen.
+
+        Returns:
+            bool: True if the fleet has reached the bottom, False otherwise.
+        """
+        if self.lowest is None:
+            return False
+        return bool(self.y[self.lowest.index] + self.settings.alien_h >= self.settings.screen_h)
@@ -0,0 +1,145 @@
+
+import pygame
+import numpy as np
+from renderer import collect_scene_items
+from numpy_fleet import NumpyAlienFleet
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class ObservationExporter:
+    """
+    Exports the rendered frame and the positions of the ship, aliens and bullets as NumPy
+    arrays that are allocated once and reused every frame.
+    The scene is drawn into a surface that shares its pixels with a NumPy array, so the frame
+    is a view of that array, downsampled by striding, and is never copied or locked.
+    The exported arrays are overwritten by the next export; copy them to keep them.
+    """
+    def __init__(self, game: "AlienInvasion", downsample: int = 1) -> None:
+        """
+        Initialize the exporter and allocate its arrays.
+
+        Args:
+            game (AlienInvasion): The main game instance.
+            downsample (int): keep every n-th pixel of every n-th row of the frame.
+        """
+        if downsample < 1:
+            raise ValueError("downsample must be at least 1")
+        self.game = game
+        width, height = game.screen.get_size()
+        self.pixels = np.zeros((height, width, 4), dtype=np.uint8)
+        self.canvas = pygame.image.frombuffer(self.pixels, (width, height), "BGRA")
+        # Row-major RGB view of the canvas, with every n-th pixel of every n-th row
+        self.frame = self.pixels[::downsample, ::downsample, 2::-1]
+
+        self.ship = np.zeros(2, dtype=np.int32)
+        self._allocate_aliens(self._get_grid_cells())
+        self._allocate_bullets(max(game.settings.bullets_amount or 0, 1))
+
+    def _get_grid_cells(self) -> int:
+        """
+        Get the number of cells in the fleet grid, the most aliens one formation can hold.
+
+        Returns:
+            int: the number of fleet grid cells.
+        """
+        _, _, fleet_w, fleet_h, _, _ = self.game.alien_fleet._get_fleet_geometry()
+        return fleet_w * fleet_h
+
+    def _allocate_aliens(self, capacity: int) -> None:
+        """
+        Allocate the alien position arrays.
+
+        Args:
+            capacity (int): the number of aliens the arrays hold.
+        """
+        self.aliens = np.zeros((capacity, 2), dtype=np.int32)
+        self._alien_values = memoryview(self.aliens).cast("B").cast("i")
+        self._alien_scratch = np.zeros(capacity, dtype=float)
+
+    def _allocate_bullets(self, capacity: int) -> None:
+        """
+        Allocate the bullet position array.
+
+        Args:
+            capacity (int): the number of bullets the array holds.
+        """
+        self.bullets = np.zeros((capacity, 2), dtype=np.int32)
+        self._bullet_values = memoryview(self.bullets).cast("B").cast("i")
+
+    def render(self, alpha: float = 1.0) -> np.ndarray:
+        """
+        Draw the scene into the exporter's canvas.
+
+        Args:
+            alpha (float): interpolation between the previous and the current simulation step.
+
+        Returns:
+            np.ndarray: the (height, width, 3) RGB view of the frame, downsampled.
+        """
+        self.canvas.blit(self.game.bg, (0, 0))
+        self.canvas.blits(collect_scene_items(self.game, alpha), doreturn=False)
+        return self.frame
+
+    def export_state(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Write the top-left positions of the ship, the living aliens and the bullets in flight
+        into the exporter's arrays. The arrays only grow if there are more entities than they hold.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: the ship position, and views of the
+                alien and bullet positions, one (x, y) row each.
+        """
+        self.ship[0] = self.game.ship.rect.x
+        self.ship[1] = self.game.ship.rect.y
+        return self.ship, self._export_aliens(), self._export_bullets()
+
+    def _export_aliens(self) -> np.ndarray:
+        """
+        Write the alien positions. A NumPy fleet is exported with array operations straight
+        from its position arrays; a sprite fleet is written alien by alien without building lists.
+
+        Returns:
+            np.ndarray: a view of the alien positions.
+        """
+        fleet = self.game.alien_fleet
+        count = len(fleet.fleet)
+        if count > len(self.aliens):
+            self._allocate_aliens(max(count, 2 * len(self.aliens)))
+        aliens = self.aliens[:count]
+        if isinstance(fleet, NumpyAlienFleet):
+            scratch = self._alien_scratch[:count]
+            for column, positions in enumerate((fleet.x, fleet.y)):
+                np.compress(fleet.alive, positions, out=scratch)
+                np.rint(scratch, out=aliens[:, column], casting="unsafe")
+            return aliens
+        values = self._alien_values
+        index = 0
+        for alien in fleet.fleet:
+            rect = alien.rect
+            values[index] = rect.x
+            values[index + 1] = rect.y
+            index += 2
+        return aliens
+
+    def _export_bullets(self) -> np.ndarray:
+        """
+        Write the positions of the bullets in flight.
+
+        Returns:
+            np.ndarray: a view of the bullet positions.
+        """
+        arsenal = self.game.ship.arsenal.arsenal
+        count = len(arsenal)
+        if count > len(self.bullets):
+            self._allocate_bullets(max(count, 2 * len(self.bullets)))
+        values = self._bullet_values
+        index = 0
+        for bullet in arsenal:
+            rect = bullet.rect
+            values[index] = rect.x
+            values[index + 1] = rect.y
+            index += 2
+        return self.bullets[:count]
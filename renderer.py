@@ -0,0 +1,257 @@
+
+import pygame
+from time import perf_counter
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+# A draw item is an image and the rect it is blitted at
+DrawItem = tuple[pygame.Surface, pygame.Rect]
+
+
+def collect_scene_items(game: "AlienInvasion", alpha: float = 1.0) -> list[DrawItem]:
+    """
+    Collect the draw items of the whole scene in drawing order.
+
+    Args:
+        game (AlienInvasion): The main game instance.
+        alpha (float): interpolation between the previous and the current simulation step.
+
+    Returns:
+        list[DrawItem]: the images and rects to draw, back to front.
+    """
+    items = game.ship.get_draw_items(alpha)
+    items += game.alien_fleet.get_draw_items(alpha)
+    items += game.HUD.get_draw_items()
+    if not game.game_active:
+        items += game.play_button.get_draw_items()
+    return items
+
+
+def get_image_version(game: "AlienInvasion", image: pygame.Surface) -> int:
+    """
+    Get the version of an image that is redrawn in place, so a renderer can tell it changed
+    even though it is the same surface. Only the fleet's composite surface is redrawn in place.
+
+    Args:
+        game (AlienInvasion): The main game instance.
+        image (pygame.Surface): an image of a draw item.
+
+    Returns:
+        int: the image's version, 0 for images that never change.
+    """
+    fleet = game.alien_fleet
+    return fleet.composite_version if image is fleet.composite else 0
+
+
+class DirtyRenderer:
+    """
+    Renderer that only repaints the parts of the screen that changed since the last frame.
+    Every frame the game's draw items are compared with the previous frame's; the areas of the
+    items that moved, appeared, disappeared or changed image are repainted from the background
+    and pushed to the display with display.update(rects) instead of a full-screen flip.
+    """
+    def __init__(self, game: "AlienInvasion") -> None:
+        """
+        Initialize the renderer.
+
+        Args:
+            game (AlienInvasion): The main game instance.
+        """
+        self.game = game
+        self.settings = game.settings
+        self.screen = game.screen
+        self.boundaries = self.screen.get_rect()
+        self.previous: set[tuple[int, int, int, int, int, int]] = set()
+        self.previous_rects: dict[tuple[int, int, int, int, int, int], pygame.Rect] = {}
+        # Holding the previous frame's items keeps their images alive, so their ids can't be reused
+        self.previous_items: list[DrawItem] = []
+        self.full_redraw = True
+
+    def invalidate(self) -> None:
+        """
+        Force the next frame to repaint the whole screen.
+        """
+        self.full_redraw = True
+
+    def collect_items(self, alpha: float = 1.0) -> list[DrawItem]:
+        """
+        Collect the draw items of the whole scene in drawing order.
+
+        Args:
+            alpha (float): interpolation between the previous and the current simulation step.
+
+        Returns:
+            list[DrawItem]: the images and rects to draw, back to front.
+        """
+        return collect_scene_items(self.game, alpha)
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draw the scene and update only the changed areas of the display.
+        When more than half of the screen changed, the whole screen is repainted and flipped instead.
+
+        Args:
+            alpha (float): interpolation between the previous and the current simulation step.
+        """
+        items = self.collect_items(alpha)
+        current_rects = {(id(image), *rect, get_image_version(self.game, image)): rect for image, rect in items}
+        current = set(current_rects)
+
+        if not self.full_redraw:
+            if current == self.previous:
+                return
+            dirty = [self.previous_rects[key] for key in self.previous - current]
+            dirty += [current_rects[key] for key in current - self.previous]
+            dirty = [rect.clip(self.boundaries) for rect in dirty]
+            dirty_area = sum(rect.w * rect.h for rect in dirty)
+            if dirty_area > self.boundaries.w * self.boundaries.h // 2:
+                self.full_redraw = True
+
+        if self.full_redraw:
+            self.screen.blit(self.game.bg, (0, 0))
+            self.screen.blits(items, doreturn=False)
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            self._repaint(items, dirty)
+            pygame.display.update(dirty)
+
+        self.previous = current
+        self.previous_items = items
+        self.previous_rects = {key: rect.copy() for key, rect in current_rects.items()}
+
+    def _repaint(self, items: list[DrawItem], dirty: list[pygame.Rect]) -> None:
+        """
+        Repaint each dirty area from the background and redraw the items that overlap it,
+        clipped to the area so the items outside of it are not blended twice.
+
+        Args:
+            items (list[DrawItem]): the scene's draw items, back to front.
+            dirty (list[pygame.Rect]): the areas to repaint.
+        """
+        item_rects = [rect for _, rect in items]
+        for area in dirty:
+            if not area:
+                continue
+            self.screen.set_clip(area)
+            self.screen.blit(self.game.bg, area, area)
+            for index in area.collidelistall(item_rects):
+                self.screen.blit(*items[index])
+        self.screen.set_clip(None)
+
+
+class ScaledRenderer:
+    """
+    Renderer that draws the scene at a reduced internal resolution and upscales it to the window.
+    Game coordinates stay in window pixels; each draw item is blitted at its scaled position
+    with a scaled copy of its image, cached for as long as the image keeps being drawn.
+    With `settings.render_scale` set to "auto", the scale starts at 1.0 and is lowered a step
+    whenever the measured frame time stays over the frame budget.
+    """
+    def __init__(self, game: "AlienInvasion") -> None:
+        """
+        Initialize the renderer at the configured scale.
+
+        Args:
+            game (AlienInvasion): The main game instance.
+        """
+        self.game = game
+        self.settings = game.settings
+        self.screen = game.screen
+        self.auto = self.settings.render_scale == "auto"
+        fps = self.settings.FPS or self.settings.sim_rate
+        self.frame_budget = self.settings.render_scale_headroom / fps
+        self.frame_times: deque[float] = deque(maxlen=self.settings.render_scale_window)
+        self.last_draw: float | None = None
+        self.set_scale(1.0 if self.auto else float(self.settings.render_scale))
+
+    def set_scale(self, scale: float) -> None:
+        """
+        Change the render scale, creating the internal surface for it and dropping the scaled images.
+
+        Args:
+            scale (float): the internal resolution as a fraction of the window size.
+        """
+        self.scale = scale
+        width, height = self.screen.get_size()
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        self.surface = pygame.Surface(size).convert() if scale != 1.0 else self.screen
+        # Scaled images by id and version of the original, holding the original so its id can't be reused
+        self.scaled: dict[tuple[int, int], tuple[pygame.Surface, pygame.Surface]] = {}
+        self.bg: tuple[pygame.Surface, pygame.Surface] | None = None
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draw the scene at the render scale and show it in the window.
+
+        Args:
+            alpha (float): interpolation between the previous and the current simulation step.
+        """
+        if self.auto:
+            self._adapt_scale()
+        items = collect_scene_items(self.game, alpha)
+        if self.scale == 1.0:
+            self.screen.blit(self.game.bg, (0, 0))
+            self.screen.blits(items, doreturn=False)
+        else:
+            self.surface.blit(self._get_scaled_bg(), (0, 0))
+            self.surface.blits(self._scale_items(items), doreturn=False)
+            pygame.transform.scale(self.surface, self.screen.get_size(), self.screen)
+        pygame.display.flip()
+
+    def _get_scaled_bg(self) -> pygame.Surface:
+        """
+        Get the background at the render resolution, scaling it again only after it was replaced.
+
+        Returns:
+            pygame.Surface: the scaled background.
+        """
+        if self.bg is None or self.bg[0] is not self.game.bg:
+            scaled = pygame.transform.smoothscale(self.game.bg, self.surface.get_size())
+            self.bg = (self.game.bg, scaled)
+        return self.bg[1]
+
+    def _scale_items(self, items: list[DrawItem]) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """
+        Get the scaled images and positions of the draw items.
+        Images that were not drawn this frame are dropped from the cache.
+
+        Args:
+            items (list[DrawItem]): the scene's draw items, back to front.
+
+        Returns:
+            list: (scaled image, scaled position) pairs, back to front.
+        """
+        scale = self.scale
+        previous = self.scaled
+        self.scaled = {}
+        scaled_items = []
+        for image, rect in items:
+            key = (id(image), get_image_version(self.game, image))
+            entry = self.scaled.get(key) or previous.get(key)
+            if entry is None:
+                size = (max(1, round(rect.w * scale)), max(1, round(rect.h * scale)))
+                entry = (image, pygame.transform.smoothscale(image, size))
+            self.scaled[key] = entry
+            scaled_items.append((entry[1], (round(rect.x * scale), round(rect.y * scale))))
+        return scaled_items
+
+    def _adapt_scale(self) -> None:
+        """
+        Measure the time since the previous frame and lower the scale by one step when a full
+        window of frames averaged more than the frame budget.
+        """
+        now = perf_counter()
+        if self.last_draw is not None:
+            self.frame_times.append(now - self.last_draw)
+        self.last_draw = now
+        if len(self.frame_times) < self.frame_times.maxlen or self.scale <= self.settings.render_scale_min:
+            return
+        if sum(self.frame_times) / len(self.frame_times) > self.frame_budget:
+            self.set_scale(max(self.settings.render_scale_min, self.scale - self.settings.render_scale_step))
+            self.frame_times.clear()
+            # The time spent rescaling isn't a rendering cost to measure
+            self.last_draw = None
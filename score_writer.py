@@ -0,0 +1,125 @@
+
+import os
+import json
+import stat
+import tempfile
+import threading
+from pathlib import Path
+
+
+class ScoreWriter:
+    """
+    Writes the saved scores to disk off the game loop.
+    Scores handed to `submit` are only marked as pending; a background thread writes the
+    latest pending scores at most once per interval. Every write goes to a temporary file
+    that then replaces the scores file, so a crash during a write never leaves a broken file.
+    """
+    def __init__(self, path: Path, interval: float) -> None:
+        """
+        Initialize the writer. The background thread starts with the first submitted scores.
+
+        Args:
+            path (Path): the scores file.
+            interval (float): seconds between background writes.
+        """
+        self.path = path
+        self.interval = interval
+        self._pending: dict | None = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, scores: dict) -> None:
+        """
+        Mark the scores as pending; they are written by the background thread.
+
+        Args:
+            scores (dict): the scores to save.
+        """
+        with self._lock:
+            self._pending = dict(scores)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ScoreWriter", daemon=True)
+            self._thread.start()
+
+    def flush(self) -> None:
+        """
+        Write the pending scores now, if there are any.
+        """
+        with self._lock:
+            scores = self._pending
+            self._pending = None
+        if scores is not None:
+            self._write(scores)
+
+    def write(self, scores: dict) -> None:
+        """
+        Write the scores now, replacing any pending ones.
+
+        Args:
+            scores (dict): the scores to save.
+        """
+        with self._lock:
+            self._pending = None
+        self._write(scores)
+
+    def close(self) -> None:
+        """
+        Stop the background thread and write any pending scores.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        """
+        Background loop that writes the pending scores once per interval until the writer is closed.
+        """
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def _write(self, scores: dict) -> None:
+        """
+        Atomically write the scores as JSON, through a temporary file in the same folder that
+        gets the scores file's permissions. A failed write is reported and leaves the old file as it was.
+
+        Args:
+            scores (dict): the scores to save.
+        """
+        contents = json.dumps(scores, indent=4)
+        with self._write_lock:
+            try:
+                fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+            except FileNotFoundError as e:
+                print(f"File not found: {e}")
+                return
+            except OSError as e:
+                print(f"Could not save the scores: {e}")
+                return
+            try:
+                with os.fdopen(fd, "w") as file:
+                    file.write(contents)
+                    file.flush()
+                    os.fsync(file.fileno())
+                # mkstemp creates the file readable by its owner only
+                os.chmod(temp_path, self._get_mode())
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                # Leave the old scores file untouched and don't leave the partial write behind
+                print(f"Could not save the scores: {e}")
+                Path(temp_path).unlink(missing_ok=True)
+
+    def _get_mode(self) -> int:
+        """
+        Get the permissions of the scores file, or the usual ones for a new file if it doesn't exist yet.
+
+        Returns:
+            int: the permission bits.
+        """
+        try:
+            return stat.S_IMODE(os.stat(self.path).st_mode)
+        except FileNotFoundError:
+            return 0o644
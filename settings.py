@@ -18,15 +18,27 @@ class Settings:
         self.name: str = "Alien Invasion"
         self.screen_w: int = 1200
         self.screen_h: int = 800
-        self.FPS = 60   
+        self.FPS = 60   # Render frame rate cap, 0 renders as fast as possible
+        self.sim_rate = 60 # Fixed simulation steps per second, independent of the render rate
+        self.time_step = 1 / self.sim_rate
+        self.max_catch_up_steps = 5 # Most simulation steps run in one frame before the game slows down instead
+        self.transition_time = 1.0 # Seconds the game pauses after losing a ship or clearing a level
+        self.renderer = "full" # "full" repaints and flips the whole screen, "dirty" only updates changed areas
+        self.render_scale = 1.0 # Internal resolution as a fraction of the window, or "auto" to lower it when frames run late
+        self.render_scale_min = 0.5 # Lowest scale the automatic mode goes down to
+        self.render_scale_step = 0.25 # How much the automatic mode lowers the scale at a time
+        self.render_scale_window = 60 # Frames the automatic mode averages the frame time over
+        self.render_scale_headroom = 1.1 # Automatic mode lowers the scale when frames average this many frame budgets
         """
         self.bg_file source:
         Source URL: https://www.pexels.com/photo/space-background-11657224/
         filename: pexels-photo-11657224.jpeg
         """
         self.bg_file = Path.cwd() / "Assets" / "images" / "pexels-photo-11657224.png"        
+        self.bg_color = (0, 0, 0) # Background drawn until the background image has loaded
         self.difficulty_scale = 1.1 # Scale factor for increasing difficulty
         self.scores_file = Path.cwd() / "Assets" / "file" / "scores.json" # File to save the scores
+        self.scores_flush_interval = 2.0 # Seconds between background writes of a new hi score
         
         # Initialize the game ship settings - the player's ship
         """
@@ -51,6 +63,12 @@ class Settings:
         self.alien_w = 40
         self.alien_h = 40
         self.fleet_direction = 1
+        self.spawn_chance = 5 # Chance (out of 100) of spawning an alien in each fleet grid cell, 100 fills every cell
+        self.fleet_layers = 1 # Formations stacked into each fleet, more than one for stress testing
+        self.fleet_backend = "sprite" # "sprite" moves each alien sprite, "numpy" moves the fleet as arrays
+        self.use_spatial_hash = True # Look up collision candidates in a grid instead of testing every pair
+        self.formation_cache_size = 2 # Upcoming fleet formations generated ahead of time
+        self.fleet_render_mode = "sprites" # "sprites" blits each alien, "composite" blits one pre-composed fleet surface
         
         # Initialize button settings
         self.button_w = 200
@@ -76,6 +94,22 @@ class Settings:
         self.HUD_font_color = (255, 255, 255)
         self.HUD_font_file = Path.cwd() / "Assets" / "Fonts" / "final-frontier-shipside-font" / "FinalFrontierShipside-Y6O.ttf"
         
+        # Initialize the frame profiler overlay settings, toggled in game with F3
+        self.profiler_window = 120 # Frames the rolling timings and the frame-time graph cover
+        self.profiler_refresh = 0.25 # Seconds between overlay redraws
+        self.profiler_font_size = 14
+        self.profiler_color = (0, 0, 0, 170)
+        
+        # Initialize the cProfile capture settings, triggered in game with F4
+        self.profile_dir = Path.cwd() / "profiles" # Folder the .pstats files and summaries are written to
+        self.profile_capture_frames = 300 # Frames covered by a capture triggered with the hotkey
+        
+        # Initialize the input latency settings
+        self.low_latency = False # Filter events, poll the arrow keys right before simulating and pace frames precisely
+        self.pacer_spin_time = 0.002 # Seconds the low-latency frame pacer spins instead of sleeping before a frame
+        self.latency_max_ms = 100 # Range of the input latency histograms, slower inputs are counted together
+        self.latency_bin_ms = 2 # Width of an input latency histogram bin
+        
         # Initialize the game sound settings
         """
         self.laser_sound source:
@@ -89,23 +123,53 @@ class Settings:
         filename: explosion-312361.mp3
         """
         self.impact_sound = Path.cwd() / "Assets" / "sound" / "explosion-312361.mp3" # Impact sound for bullets hitting aliens
+        self.sound_cache_dir = Path.cwd() / "Assets" / "cache" / "sound" # Decoded samples, so later launches skip MP3 decoding
+        self.sound_voices = {"laser_sound": 4, "impact_sound": 6} # Channels reserved for each sound
+        
+        # Settings fixed by `override`, re-applied whenever the dynamic settings are reset
+        self.overrides: dict = {}
+        
+    def override(self, **values) -> None:
+        """
+        Set settings to fixed values, e.g. for a balancing sweep.
+        Overridden dynamic settings, like fleet_speed or bullets_amount, are the values every
+        new game starts from; the difficulty still scales them up from there.
+
+        Args:
+            **values: the settings to set, by attribute name.
+        """
+        for name in values:
+            if not hasattr(self, name):
+                raise AttributeError(f"Unknown setting: {name}")
+        self.overrides.update(values)
+        self._apply_overrides()
+        
+    def _apply_overrides(self) -> None:
+        """
+        Set the overridden settings to their fixed values.
+        """
+        for name, value in self.overrides.items():
+            setattr(self, name, value)
         
     def initialize_dynamic_settings(self) -> None:
         """
         Initialize settings that change during the game.
         This method sets the initial values for ship speed, bullet speed, and fleet speed.
+        Speeds are in pixels per second.
         """         
-        self.ship_speed = 5
+        self.ship_speed = 300
         self.starting_ship_count = 3
         
-        self.bullet_speed = 7
-        self.bullets_amount = 5
+        self.bullet_speed = 420
+        self.bullets_amount = 5 # Most bullets in flight at once, None for no limit
+        self.auto_fire = False # Fire every simulation step without pressing the fire key
         self.bullet_w = 25
         self.bullet_h = 80
         
-        self.fleet_speed = 1
-        self.fleet_drop_speed = 40
+        self.fleet_speed = 60
+        self.fleet_drop_speed = 40 # Pixels dropped each time the fleet reaches an edge
         self.alien_points = 50
+        self._apply_overrides()
     
     def increase_difficulty(self) -> None:
         """
@@ -1,10 +1,12 @@
 
 import pygame
 from typing import TYPE_CHECKING
+from assets import load_image
 
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
     from arsenal import ShipArsenal      
+    from alien_fleet import AlienFleet
 
 class Ship:
     """
@@ -26,8 +28,7 @@ class Ship:
         self.screen = game.screen
         self.boundaries = self.screen.get_rect()
         
-        self.image = pygame.image.load(self.settings.ship_file)
-        self.image = pygame.transform.scale(self.image, (self.settings.ship_w, self.settings.ship_h))
+        self.image = load_image(self.settings.ship_file, (self.settings.ship_w, self.settings.ship_h))
         
         self.rect = self.image.get_rect()
         self._center_ship()
@@ -42,23 +43,31 @@ class Ship:
         """
         self.rect.midbottom = self.boundaries.midbottom
         self.x = float(self.rect.x)
+        self.previous_x = self.x
         
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         """
         Update the ship's position based on the movement flags.
-        This method is called every frame to update the ship's position and check for collisions.
+        This method is called every simulation step to update the ship's position and check for collisions.
         It also updates the ship's arsenal (bullets).
+
+        Args:
+            dt (float): length of the simulation step in seconds.
         """      
-        self._update_ship_movement()
-        self.arsenal.update_arsenal()
+        self._update_ship_movement(dt)
+        self.arsenal.update_arsenal(dt)
 
-    def _update_ship_movement(self):
+    def _update_ship_movement(self, dt: float):
         """
         Update the ship's position based on the movement flags.
         This method checks if the ship is moving left or right and updates its position accordingly.
         It also ensures that the ship does not move off-screen by checking the boundaries of the screen.
+
+        Args:
+            dt (float): length of the simulation step in seconds.
         """
-        temp_speed = self.settings.ship_speed
+        self.previous_x = self.x
+        temp_speed = self.settings.ship_speed * dt
         if self.moving_right and self.rect.right < self.boundaries.right:
             self.x += temp_speed
         if self.moving_left and self.rect.left > self.boundaries.left:
@@ -66,14 +75,40 @@ class Ship:
         
         self.rect.x = self.x
         
-    def draw(self) -> None:
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draw the ship and its arsenal (bullets) on the screen, from its draw items.
+
+        Args:
+            alpha (float): interpolation between the previous and the current simulation step.
+        """
+        self.screen.blits(self.get_draw_items(alpha), doreturn=False)
+        
+    def get_draw_items(self, alpha: float = 1.0) -> list:
+        """
+        Get the images and rects the ship draws, its bullets first and then the ship itself.
+
+        Args:
+            alpha (float): interpolation between the previous and the current simulation step.
+
+        Returns:
+            list: (image, rect) pairs in drawing order.
+        """
+        items = self.arsenal.get_draw_items(alpha)
+        items.append((self.image, self._get_render_rect(alpha)))
+        return items
+        
+    def _get_render_rect(self, alpha: float) -> pygame.Rect:
         """
-        Draw the ship on the screen.
-        This method will be called in the game loop to ensure that the ship is drawn on the screen.
-        It will also draw the ship's arsenal (bullets) on the screen.
+        Get the rect to draw the ship at, interpolated between its previous and current position.
+
+        Args:
+            alpha (float): how far the frame is between the previous step (0) and the current step (1).
+
+        Returns:
+            pygame.Rect: the ship's rect moved back by the part of the last step not yet shown.
         """
-        self.arsenal.draw()
-        self.screen.blit(self.image, self.rect)
+        return self.rect.move(round((alpha - 1) * (self.x - self.previous_x)), 0)
                
     
     def fire(self) -> bool:
@@ -88,17 +123,16 @@ class Ship:
         return self.arsenal.fire_bullet()
     
     
-    def check_collisions(self, other_group) -> bool:
+    def check_collisions(self, alien_fleet: "AlienFleet") -> bool:
         """
-        Check for collisions between the ship and another group of sprites.
+        Check for collisions between the ship and the alien fleet.
         
         Args:
-            other_group (holding class): the group of sprites to check for collisions with.
-        This could be a group of aliens, bullets, or any other sprites in the game.
+            alien_fleet (AlienFleet): the fleet to check for collisions with.
         Returns:
-            bool: True if the ship has collided with any of the sprites in the other group.
+            bool: True if the ship has collided with any of the aliens in the fleet.
         """
-        if pygame.sprite.spritecollideany(self, other_group):
+        if alien_fleet.spritecollideany(self):
             self._center_ship()
             return True
         return False
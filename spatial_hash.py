@@ -0,0 +1,70 @@
+
+import pygame
+from pygame.sprite import Sprite
+from typing import Iterable, Iterator
+
+
+class SpatialHash:
+    """
+    Uniform grid over the screen used as a broad phase for collision checks.
+    Each sprite is stored in the cell that holds its top-left corner, so sprites must not be
+    larger than one cell; a query then only has to look at the cells the rect covers plus one
+    cell to the left and above.
+    """
+    def __init__(self, cell_w: int, cell_h: int) -> None:
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_w (int): width of a grid cell, at least the width of the stored sprites.
+            cell_h (int): height of a grid cell, at least the height of the stored sprites.
+        """
+        self.cell_w = cell_w
+        self.cell_h = cell_h
+        self.cells: dict[tuple[int, int], list[Sprite]] = {}
+
+    def build(self, sprites: Iterable[Sprite]) -> None:
+        """
+        Clear the grid and insert all the given sprites.
+
+        Args:
+            sprites (Iterable[Sprite]): the sprites to index.
+        """
+        self.cells = {}
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def insert(self, sprite: Sprite) -> None:
+        """
+        Add a sprite to the cell that holds its top-left corner.
+
+        Args:
+            sprite (Sprite): the sprite to add.
+        """
+        key = (sprite.rect.x // self.cell_w, sprite.rect.y // self.cell_h)
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = [sprite]
+        else:
+            cell.append(sprite)
+
+    def query(self, rect: pygame.Rect) -> Iterator[Sprite]:
+        """
+        Yield the sprites that may overlap the given rect.
+
+        Args:
+            rect (pygame.Rect): the area to look up.
+
+        Yields:
+            Sprite: each candidate sprite once.
+        """
+        first_col = rect.left // self.cell_w - 1
+        last_col = (rect.right - 1) // self.cell_w
+        first_row = rect.top // self.cell_h - 1
+        last_row = (rect.bottom - 1) // self.cell_h
+        cells = self.cells
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                cell = cells.get((col, row))
+                if cell:
+                    yield from cell
@@ -0,0 +1,159 @@
+
+import json
+import argparse
+import numpy as np
+from time import perf_counter
+from alien_invasion import AlienInvasion
+
+
+class StressTest:
+    """
+    Ramps up the number of aliens and bullets on a headless game until the frame loop
+    misses its frame budget, then narrows down the entity count at which it does.
+    Every level of the ramp stacks more full formations into the fleet, with unlimited
+    bullets and automatic fire, and times whole frames: one simulation step and a render.
+    """
+    def __init__(self, frames: int = 120, seed: int = 0, spawn_chance: int = 100,
+                 fleet_backend: str = "sprite") -> None:
+        """
+        Initialize the stress test and the headless game it runs on.
+
+        Args:
+            frames (int): number of frames measured at each level of the ramp.
+            seed (int): seed for the random fleet layout, so runs are comparable.
+            spawn_chance (int): chance (out of 100) of an alien in each fleet grid cell.
+            fleet_backend (str): the fleet backend to measure, "sprite" or "numpy".
+        """
+        self.frames = frames
+        self.seed = seed
+        self.game = AlienInvasion(headless=True, seed=seed, overrides={
+            "spawn_chance": spawn_chance,
+            "fleet_backend": fleet_backend,
+            "bullets_amount": None,
+            "auto_fire": True,
+            })
+        self.frame_budget = 1 / self.game.settings.FPS
+
+    def run_level(self, layers: int) -> dict:
+        """
+        Measure the frame time with the given number of stacked formations.
+        Pauses after a lost ship or cleared level are skipped, and a new game is started
+        when the last ship is lost, so every measured frame is full gameplay.
+
+        Args:
+            layers (int): number of formations stacked into the fleet.
+
+        Returns:
+            dict: the layers, the average entity counts and the frame times.
+        """
+        game = self.game
+        game.settings.fleet_layers = layers
+        game.rng.seed(self.seed)
+        game.alien_fleet.formations.clear()
+        game.restart_game()
+        time_step = game.settings.time_step
+        frame_times = []
+        entity_counts = []
+
+        for _ in range(self.frames):
+            if not game.game_active:
+                game.restart_game()
+            entity_counts.append(len(game.alien_fleet.fleet) + len(game.ship.arsenal.arsenal))
+            start = perf_counter()
+            game._update_simulation(time_step)
+            game._update_screen()
+            frame_times.append(perf_counter() - start)
+            if game.transition_action is not None:
+                game._update_transition(game.transition_remaining)
+
+        times_ms = np.asarray(frame_times) * 1000
+        return {
+            "layers": layers,
+            "mean_entities": float(np.mean(entity_counts)),
+            "mean_frame_ms": float(times_ms.mean()),
+            "p99_frame_ms": float(np.percentile(times_ms, 99)),
+            }
+
+    def run(self, max_layers: int = 64) -> dict:
+        """
+        Double the stacked formations from one until the mean frame time goes over budget,
+        then bisect between the last layer count that held the budget and the first one that
+        missed it, so the breaking point is found to a single layer.
+
+        Args:
+            max_layers (int): stop the ramp after this many layers even if the budget holds.
+
+        Returns:
+            dict: the test parameters, the result of every level by layer count, the entity
+                count at which the budget was first missed, None if it never was, and the
+                entity count of the most layers that still held it, None if none did.
+        """
+        results = []
+        budget_ms = self.frame_budget * 1000
+        passing = None # Result of the most layers known to hold the budget
+        failing = None # Result of the fewest layers known to miss it
+        layers = 1
+        while layers <= max_layers:
+            result = self.run_level(layers)
+            results.append(result)
+            if result["mean_frame_ms"] > budget_ms:
+                failing = result
+                break
+            passing = result
+            layers *= 2
+        
+        while passing is not None and failing is not None and failing["layers"] - passing["layers"] > 1:
+            result = self.run_level((passing["layers"] + failing["layers"]) // 2)
+            results.append(result)
+            if result["mean_frame_ms"] > budget_ms:
+                failing = result
+            else:
+                passing = result
+        results.sort(key=lambda result: result["layers"])
+        return {
+            "frames": self.frames,
+            "seed": self.seed,
+            "spawn_chance": self.game.settings.spawn_chance,
+            "fleet_backend": self.game.settings.fleet_backend,
+            "frame_budget_ms": budget_ms,
+            "breaking_point_entities": failing["mean_entities"] if failing is not None else None,
+            "last_passing_entities": passing["mean_entities"] if passing is not None else None,
+            "results": results,
+            }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Run the stress ramp from the command line and report the entity count that misses the frame budget.
+
+    Args:
+        argv (list[str] | None): the command line arguments, defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Stress test for Alien Invasion")
+    parser.add_argument("--frames", type=int, default=120, help="frames measured at each level")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the fleet layout")
+    parser.add_argument("--density", type=int, default=100,
+                        help="fleet spawn chance, 100 fills every grid cell")
+    parser.add_argument("--max-layers", type=int, default=64, help="most formations stacked into the fleet")
+    parser.add_argument("--fleet-backend", choices=["sprite", "numpy"], default="sprite",
+                        help="alien fleet backend to measure")
+    parser.add_argument("--output", default=None, help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = StressTest(args.frames, args.seed, args.density, args.fleet_backend).run(args.max_layers)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(json.dumps(report, indent=4))
+    for result in report["results"]:
+        print(f"{result['layers']:>3} layers: {result['mean_entities']:8.0f} entities, "
+              f"{result['mean_frame_ms']:6.2f} ms mean, {result['p99_frame_ms']:6.2f} ms p99")
+    if report["breaking_point_entities"] is None:
+        print(f"The {report['frame_budget_ms']:.1f} ms budget held up to {args.max_layers} layers")
+    else:
+        print(f"Missed the {report['frame_budget_ms']:.1f} ms budget at {report['breaking_point_entities']:.0f} entities")
+        if report["last_passing_entities"] is not None:
+            print(f"The budget held at {report['last_passing_entities']:.0f} entities")
+
+
+if __name__ == '__main__':
+    main()